@@ -4,7 +4,18 @@ Extracts vote data from Ctrl+A Ctrl+C raw text content.
 """
 
 import re
-from typing import Dict, Optional, Tuple
+import sys
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+# Optional acceleration for bulk ingestion; the app itself only needs
+# the stdlib, so missing numpy/numba just disables the fast bulk path.
+try:
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _njit = None
 
 # =============================================================================
 # Fragrantica option names -> our system's key mapping
@@ -46,91 +57,257 @@ VALUE_MAP = {
     "great value": "excellent"
 }
 
+# Lowercased option-name -> our-key lookup, one per category. Our keys
+# are interned so the result-dict inserts hit the pointer-identity fast
+# path in the str equality check.
+_RATING_LOOKUP = {opt: sys.intern(opt) for opt in RATING_OPTIONS}
+_SEASON_TIME_LOOKUP = {opt: sys.intern(opt) for opt in SEASON_TIME_OPTIONS}
+_LONGEVITY_LOOKUP = {k.lower(): sys.intern(v) for k, v in LONGEVITY_MAP.items()}
+_SILLAGE_LOOKUP = {opt: sys.intern(opt) for opt in SILLAGE_OPTIONS}
+_GENDER_LOOKUP = {k.lower(): sys.intern(v) for k, v in GENDER_MAP.items()}
+_VALUE_LOOKUP = {k.lower(): sys.intern(v) for k, v in VALUE_MAP.items()}
+
+# Lowercased section marker -> (result key, option lookup)
+SECTION_MARKERS = {
+    "rating": ("rating_votes", _RATING_LOOKUP),
+    "user ratings": ("rating_votes", _RATING_LOOKUP),
+    "when to wear": ("season_time_votes", _SEASON_TIME_LOOKUP),
+    "longevity": ("longevity_votes", _LONGEVITY_LOOKUP),
+    "sillage": ("sillage_votes", _SILLAGE_LOOKUP),
+    "gender": ("gender_votes", _GENDER_LOOKUP),
+    "price value": ("value_votes", _VALUE_LOOKUP),
+}
+
+# Result assembly / warning table: (result key, expected option count,
+# partial-parse %-template, section-not-found message). Both warning
+# strings are built here once; the parse loop never formats anything.
+_SECTIONS = (
+    ("rating_votes", len(RATING_OPTIONS), "Rating: found %d/%d options", "Rating section not found"),
+    ("season_time_votes", len(SEASON_TIME_OPTIONS), "Season/Time: found %d/%d options", "When To Wear section not found"),
+    ("longevity_votes", len(LONGEVITY_MAP), "Longevity: found %d/%d options", "LONGEVITY section not found"),
+    ("sillage_votes", len(SILLAGE_OPTIONS), "Sillage: found %d/%d options", "SILLAGE section not found"),
+    ("gender_votes", len(GENDER_MAP), "Gender: found %d/%d options", "GENDER section not found"),
+    ("value_votes", len(VALUE_MAP), "Price Value: found %d/%d options", "PRICE VALUE section not found"),
+)
+
+
+def _build_scan_pattern(space: str = r'[^\S\n]') -> str:
+    """
+    Combine every section marker and option name, plus the vote-count
+    token, into one alternation scanned line-anchored over the raw text.
+    A single linear pass then replaces all per-section keyword loops.
+    Lines are padded with `space`, which defaults to any non-newline
+    whitespace: web-page copies pad lines with NBSP and friends, and the
+    line.strip() this scan replaces removed those too.
+    """
+    keywords = set(SECTION_MARKERS)
+    for _, lookup in SECTION_MARKERS.values():
+        keywords.update(lookup)
+    alternation = "|".join(
+        re.escape(k) for k in sorted(keywords, key=len, reverse=True)
+    )
+    return r'^%s*(?:(?P<kw>%s)|(?P<num>[\d,]+\.?\d*[km]?))%s*$' % (
+        space, alternation, space)
+
+
+_SCAN_FLAGS = re.IGNORECASE | re.MULTILINE
+_SCAN_RE = re.compile(_build_scan_pattern(), _SCAN_FLAGS)
+# Keywords and digits are pure ASCII, so an ASCII document can be scanned
+# as bytes: comparisons and dict probes then skip the PEP 393 kind
+# dispatch that str operations carry. ASCII padding classes suffice here:
+# input with NBSP fails isascii() and takes the str pattern above.
+_SCAN_RE_B = re.compile(
+    _build_scan_pattern(r'[ \t\r]').encode('ascii'), _SCAN_FLAGS)
+_SECTION_MARKERS_B = {
+    marker.encode('ascii'): (key, {opt.encode('ascii'): our for opt, our in lookup.items()})
+    for marker, (key, lookup) in SECTION_MARKERS.items()
+}
+
 
 # =============================================================================
 # Utility functions
 # =============================================================================
 
-def parse_vote_count(s: str) -> int:
+# Suffix multiplier table; folding case in here replaces the lower()
+# copy plus the endswith chain with one dict probe on the last char.
+_SCALE = {'k': 1000, 'K': 1000, 'm': 1000000, 'M': 1000000}
+
+
+def _parse_vote_count_slow(s: str) -> int:
     """
-    Convert vote count string to integer.
-    Supports formats: '548', '1.4k', '2.5m'
+    Fallback for tokens the fast path does not recognize.
     """
-    s = s.strip().lower().replace(',', '')
+    s = s.strip().replace(',', '')
     if not s:
         return 0
-    
+
+    mult = _SCALE.get(s[-1], 1)
+    if mult != 1:
+        s = s[:-1]
     try:
-        if s.endswith('k'):
-            return int(float(s[:-1]) * 1000)
-        elif s.endswith('m'):
-            return int(float(s[:-1]) * 1000000)
-        else:
-            return int(float(s))
+        return int(float(s) * mult)
     except ValueError:
         return 0
 
 
-def _find_section_start(lines: list, markers: list) -> int:
+def parse_vote_count(s: str) -> int:
     """
-    Find section start position (any marker match).
-    Returns line index, or -1 if not found.
+    Convert vote count string to integer.
+    Supports formats: '548', '1.4k', '2.5m'
+
+    Well-formed tokens are parsed in a single character scan with no
+    intermediate strings or float round-trip; anything unexpected is
+    handed to the original slow path.
     """
-    for i, line in enumerate(lines):
-        line_lower = line.strip().lower()
-        for marker in markers:
-            if line_lower == marker.lower():
-                return i
-    return -1
+    n = 0              # integer mantissa
+    frac = 0           # fractional digits as an integer
+    scale = 1          # 10 ** number of fractional digits
+    mult = 0           # suffix multiplier, 0 while no suffix seen
+    seen_digit = False
+    in_frac = False
+    ended = False      # hit trailing whitespace / suffix
+
+    for c in s:
+        if c in ' \t\r\n':
+            if seen_digit:
+                ended = True
+            continue
+        if ended:
+            return _parse_vote_count_slow(s)
+        if '0' <= c <= '9':
+            d = ord(c) - 48
+            if in_frac:
+                frac = frac * 10 + d
+                scale *= 10
+            else:
+                n = n * 10 + d
+            seen_digit = True
+        elif c == ',':
+            if in_frac or not seen_digit:
+                return _parse_vote_count_slow(s)
+        elif c == '.':
+            if in_frac:
+                return _parse_vote_count_slow(s)
+            in_frac = True
+        elif c in 'kK':
+            if not seen_digit:
+                return _parse_vote_count_slow(s)
+            mult = 1000
+            ended = True
+        elif c in 'mM':
+            if not seen_digit:
+                return _parse_vote_count_slow(s)
+            mult = 1000000
+            ended = True
+        else:
+            return _parse_vote_count_slow(s)
+
+    if not seen_digit:
+        return _parse_vote_count_slow(s)
+    if mult == 0:
+        mult = 1
+    return n * mult + (frac * mult) // scale
 
 
-def _extract_option_value(lines: list, start_idx: int, option_map: dict) -> Dict[str, int]:
+if _njit is not None:
+
+    @_njit("int64[:](uint8[:], int32[:])", cache=True)
+    def _parse_vote_counts_kernel(chars, offsets):
+        """
+        Bulk variant of the parse_vote_count character scan over a flat
+        uint8 buffer; token t spans chars[offsets[t]:offsets[t + 1]].
+        Malformed tokens parse to 0 (numba can't reach the str fallback).
+        """
+        out = _np.empty(len(offsets) - 1, dtype=_np.int64)
+        for t in range(len(offsets) - 1):
+            n = 0
+            frac = 0
+            scale = 1
+            mult = 0
+            seen_digit = False
+            in_frac = False
+            ended = False
+            bad = False
+            for i in range(offsets[t], offsets[t + 1]):
+                c = chars[i]
+                if c == 32 or c == 9 or c == 13 or c == 10:
+                    if seen_digit:
+                        ended = True
+                    continue
+                if ended:
+                    bad = True
+                    break
+                if 48 <= c <= 57:
+                    d = c - 48
+                    if in_frac:
+                        frac = frac * 10 + d
+                        scale *= 10
+                    else:
+                        n = n * 10 + d
+                    seen_digit = True
+                elif c == 44:  # ','
+                    if in_frac or not seen_digit:
+                        bad = True
+                        break
+                elif c == 46:  # '.'
+                    if in_frac:
+                        bad = True
+                        break
+                    in_frac = True
+                elif c == 107 or c == 75:  # 'k' / 'K'
+                    if not seen_digit:
+                        bad = True
+                        break
+                    mult = 1000
+                    ended = True
+                elif c == 109 or c == 77:  # 'm' / 'M'
+                    if not seen_digit:
+                        bad = True
+                        break
+                    mult = 1000000
+                    ended = True
+                else:
+                    bad = True
+                    break
+            if bad or not seen_digit:
+                out[t] = 0
+            else:
+                if mult == 0:
+                    mult = 1
+                out[t] = n * mult + (frac * mult) // scale
+        return out
+
+
+def _pack_tokens(tokens: List[str]):
     """
-    Extract option-value pairs starting from given position.
-    option_map: {fragrantica_option_name: our_key}
+    Pack tokens into structure-of-arrays form: one flat uint8 char
+    buffer plus int32 offsets (token t is chars[offsets[t]:offsets[t+1]]).
+    Numba object-modes on Python str, so this is the only layout the
+    jitted kernel can chew through at native speed.
     """
-    result = {}
-    remaining_options = set(k.lower() for k in option_map.keys())
-    
-    i = start_idx
-    max_lines = min(start_idx + 50, len(lines))  # limit search range
-    
-    while i < max_lines and remaining_options:
-        line = lines[i].strip().lower()
-        
-        # Check if this is an option we're looking for
-        matched_option = None
-        for opt in remaining_options:
-            if line == opt:
-                matched_option = opt
-                break
-        
-        if matched_option:
-            # Find next non-empty line as value
-            j = i + 1
-            while j < max_lines:
-                value_line = lines[j].strip()
-                if value_line:
-                    # Check if it's a numeric format
-                    if re.match(r'^[\d,]+\.?\d*[km]?$', value_line.lower()):
-                        our_key = option_map[matched_option] if matched_option in option_map else option_map.get(matched_option.lower())
-                        if our_key:
-                            result[our_key] = parse_vote_count(value_line)
-                        remaining_options.discard(matched_option)
-                    break
-                j += 1
-        
-        i += 1
-    
-    return result
+    encoded = [t.encode('ascii', 'replace') for t in tokens]
+    offsets = _np.fromiter(
+        accumulate(map(len, encoded), initial=0),
+        dtype=_np.int32, count=len(encoded) + 1,
+    )
+    # bytearray keeps the buffer writable, matching the kernel signature
+    chars = _np.frombuffer(bytearray(b''.join(encoded)), dtype=_np.uint8)
+    return chars, offsets
 
 
-def _extract_simple_options(lines: list, start_idx: int, options: list) -> Dict[str, int]:
+def parse_vote_counts(tokens: List[str]):
     """
-    Extract simple options (option name matches our key directly).
+    Bulk-parse many vote-count tokens at once.
+
+    With numpy + numba installed the tokens are packed into a flat uint8
+    buffer and parsed by a compiled kernel (the per-string Python
+    overhead dominates for thousands of tokens); otherwise falls back to
+    parse_vote_count per token. Returns an int64 ndarray on the
+    accelerated path, a plain list otherwise.
     """
-    option_map = {opt: opt for opt in options}
-    return _extract_option_value(lines, start_idx, option_map)
+    if _njit is None:
+        return [parse_vote_count(t) for t in tokens]
+    return _parse_vote_counts_kernel(*_pack_tokens(tokens))
 
 
 # =============================================================================
@@ -156,70 +333,59 @@ def parse_fragrantica_text(text: str) -> Tuple[Dict, list]:
         }
         warnings: List of warning messages from parsing
     """
-    lines = text.split('\n')
-    result = {}
+    result = {key: {} for key, _, _, _ in _SECTIONS}
     warnings = []
-    
-    # 1. Rating (section marker: "Rating" or "User Ratings")
-    idx = _find_section_start(lines, ["Rating", "User Ratings"])
-    if idx >= 0:
-        result["rating_votes"] = _extract_simple_options(lines, idx, RATING_OPTIONS)
-        if len(result["rating_votes"]) < len(RATING_OPTIONS):
-            warnings.append(f"Rating: found {len(result['rating_votes'])}/{len(RATING_OPTIONS)} options")
-    else:
-        warnings.append("Rating section not found")
-        result["rating_votes"] = {}
-    
-    # 2. Season/Time (section marker: "When To Wear" or "When to Wear")
-    idx = _find_section_start(lines, ["When To Wear", "When to Wear"])
-    if idx >= 0:
-        result["season_time_votes"] = _extract_simple_options(lines, idx, SEASON_TIME_OPTIONS)
-        if len(result["season_time_votes"]) < len(SEASON_TIME_OPTIONS):
-            warnings.append(f"Season/Time: found {len(result['season_time_votes'])}/{len(SEASON_TIME_OPTIONS)} options")
-    else:
-        warnings.append("When To Wear section not found")
-        result["season_time_votes"] = {}
-    
-    # 3. Longevity
-    idx = _find_section_start(lines, ["LONGEVITY", "Longevity"])
-    if idx >= 0:
-        result["longevity_votes"] = _extract_option_value(lines, idx, LONGEVITY_MAP)
-        if len(result["longevity_votes"]) < len(LONGEVITY_MAP):
-            warnings.append(f"Longevity: found {len(result['longevity_votes'])}/{len(LONGEVITY_MAP)} options")
-    else:
-        warnings.append("LONGEVITY section not found")
-        result["longevity_votes"] = {}
-    
-    # 4. Sillage
-    idx = _find_section_start(lines, ["SILLAGE", "Sillage"])
-    if idx >= 0:
-        result["sillage_votes"] = _extract_simple_options(lines, idx, SILLAGE_OPTIONS)
-        if len(result["sillage_votes"]) < len(SILLAGE_OPTIONS):
-            warnings.append(f"Sillage: found {len(result['sillage_votes'])}/{len(SILLAGE_OPTIONS)} options")
-    else:
-        warnings.append("SILLAGE section not found")
-        result["sillage_votes"] = {}
-    
-    # 5. Gender
-    idx = _find_section_start(lines, ["GENDER", "Gender"])
-    if idx >= 0:
-        result["gender_votes"] = _extract_option_value(lines, idx, GENDER_MAP)
-        if len(result["gender_votes"]) < len(GENDER_MAP):
-            warnings.append(f"Gender: found {len(result['gender_votes'])}/{len(GENDER_MAP)} options")
-    else:
-        warnings.append("GENDER section not found")
-        result["gender_votes"] = {}
-    
-    # 6. Price Value
-    idx = _find_section_start(lines, ["PRICE VALUE", "Price Value"])
-    if idx >= 0:
-        result["value_votes"] = _extract_option_value(lines, idx, VALUE_MAP)
-        if len(result["value_votes"]) < len(VALUE_MAP):
-            warnings.append(f"Price Value: found {len(result['value_votes'])}/{len(VALUE_MAP)} options")
+
+    # Single linear scan of the raw text: the combined pattern yields
+    # keyword and vote-count hits in document order, so the state machine
+    # only sees interesting lines — no line splitting, no per-line lowering.
+    seen_sections = set()
+    cur_votes = None       # result sub-dict for the current section
+    cur_lookup = None      # option lookup for the current section
+    pending_key = None     # our key waiting for its numeric value line
+
+    # Fast path: ASCII input is scanned as bytes (keyword/marker tables
+    # have bytes twins); non-ASCII input falls back to the str pattern.
+    if text.isascii():
+        scan = _SCAN_RE_B.finditer(text.encode('ascii'))
+        get_section = _SECTION_MARKERS_B.get
     else:
-        warnings.append("PRICE VALUE section not found")
-        result["value_votes"] = {}
-    
+        scan = _SCAN_RE.finditer(text)
+        get_section = SECTION_MARKERS.get
+
+    for m in scan:
+        kw = m['kw']
+        if kw is None:
+            # Vote-count token
+            if pending_key is not None:
+                if pending_key not in cur_votes:
+                    tok = m['num']
+                    if type(tok) is bytes:
+                        tok = tok.decode('ascii')
+                    cur_votes[pending_key] = parse_vote_count(tok)
+                pending_key = None
+            continue
+
+        kw = kw.lower()
+        section = get_section(kw)
+        if section is not None:
+            key, cur_lookup = section
+            cur_votes = result[key]
+            seen_sections.add(key)
+            pending_key = None
+        elif cur_lookup is not None:
+            our_key = cur_lookup.get(kw)
+            if our_key is not None:
+                pending_key = our_key
+
+    for key, expected, partial_fmt, not_found in _SECTIONS:
+        if key in seen_sections:
+            found = len(result[key])
+            if found < expected:
+                warnings.append(partial_fmt % (found, expected))
+        else:
+            warnings.append(not_found)
+
     return result, warnings
 
 
@@ -8,7 +8,9 @@
 
 REPO_URL="https://github.com/boshow88/Perfume-Tracker.git"
 TARGET_DIR="Perfume-Tracker"
-MIN_PYTHON_VERSION="3.7"
+# 3.10+: dataclass(slots=True) in perfume_tracker.py needs 3.10,
+# itertools.accumulate(initial=...) in fragrantica_parser.py needs 3.8
+MIN_PYTHON_VERSION="3.10"
 AUTO_INSTALL=false
 
 # Parse arguments
@@ -107,7 +109,7 @@ PYTHON_VERSION=$($PYTHON_CMD -c "import sys; print(f'{sys.version_info.major}.{s
 PYTHON_MAJOR=$($PYTHON_CMD -c "import sys; print(sys.version_info.major)")
 PYTHON_MINOR=$($PYTHON_CMD -c "import sys; print(sys.version_info.minor)")
 
-if [ "$PYTHON_MAJOR" -lt 3 ] || ([ "$PYTHON_MAJOR" -eq 3 ] && [ "$PYTHON_MINOR" -lt 7 ]); then
+if [ "$PYTHON_MAJOR" -lt 3 ] || ([ "$PYTHON_MAJOR" -eq 3 ] && [ "$PYTHON_MINOR" -lt 10 ]); then
     echo "❌ Python $PYTHON_VERSION found, but $MIN_PYTHON_VERSION+ is required."
     echo "   Please upgrade Python manually."
     exit 1
@@ -16,14 +16,40 @@ from __future__ import annotations
 
 import json
 import os
+import queue
+import re
+import sys
+import threading
 import time
 import uuid
+from bisect import bisect_left
+from collections import Counter
 from datetime import datetime
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, partial
 from typing import Dict, List, Optional, Tuple
 
 import tkinter as tk
 
+# Optional C-speed JSON codec; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional vectorized batch scoring for large libraries; the scalar
+# cached path is used when numpy is absent
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional JIT on top of the numpy batch path
+try:
+    from numba import njit as _njit, prange as _prange
+except ImportError:
+    _njit = None
+
 # Local modules
 from fragrantica_parser import parse_fragrantica_text
 from tkinter import ttk, messagebox, simpledialog, font as tkfont
@@ -52,12 +78,12 @@ COLORS = {
 }
 
 # Fragrantica-aligned options
-RATING_5 = ["love", "like", "ok", "dislike", "hate"]
-SEASON_TIME_6 = ["spring", "summer", "fall", "winter", "day", "night"]
-LONGEVITY_5 = ["eternal", "long", "moderate", "weak", "poor"]
-SILLAGE_4 = ["enormous", "strong", "moderate", "intimate"]
-GENDER_5 = ["male", "more_male", "unisex", "more_female", "female"]
-VALUE_5 = ["excellent", "good", "fair", "expensive", "overpriced"]
+RATING_5 = ("love", "like", "ok", "dislike", "hate")
+SEASON_TIME_6 = ("spring", "summer", "fall", "winter", "day", "night")
+LONGEVITY_5 = ("eternal", "long", "moderate", "weak", "poor")
+SILLAGE_4 = ("enormous", "strong", "moderate", "intimate")
+GENDER_5 = ("male", "more_male", "unisex", "more_female", "female")
+VALUE_5 = ("excellent", "good", "fair", "expensive", "overpriced")
 
 VOTE_BLOCKS = [
     ("rating_votes", RATING_5, "Rating"),
@@ -70,36 +96,144 @@ VOTE_BLOCKS = [
 
 MY_PREFIX = "my_"
 
+# One bit per season/time and gender option, so filter eligibility for a
+# perfume collapses to a single bitwise AND against the requested set
+_SEASON_TIME_BITS = {k: 1 << i for i, k in enumerate(SEASON_TIME_6)}
+_GENDER_BITS = {k: 1 << i for i, k in enumerate(GENDER_5)}
+
+
+def _when_eligibility_mask(p: "Perfume") -> int:
+    """Bitmask of seasons/times this perfume qualifies for"""
+    fr_votes = (p.fragrantica or {}).get("season_time_votes", {})
+    my_votes = (p.my_votes or {}).get("my_season_time_votes", {})
+    mask = 0
+    for item, bit in _SEASON_TIME_BITS.items():
+        if fr_votes.get(item, 0) >= 10 or my_votes.get(item, 0) > 0:
+            mask |= bit
+    return mask
+
+
+def _gender_eligibility_mask(p: "Perfume") -> int:
+    """Bitmask of gender preferences this perfume qualifies for"""
+    fr = (p.fragrantica or {}).get("gender_votes", {})
+    my = (p.my_votes or {}).get("my_gender_votes", {})
+    mask = 0
+    for gender, bit in _GENDER_BITS.items():
+        if fr.get(gender, 0) >= 10 or my.get(gender, 0) > 0:
+            mask |= bit
+    return mask
+
 
 # -----------------------------
 # Utility functions
 # -----------------------------
+@lru_cache(maxsize=256)
 def display_label(key: str) -> str:
     """Convert internal key (with underscores) to display label (with spaces)"""
     return key.replace("_", " ")
 
 
+@lru_cache(maxsize=4096)
+def _pct_text(pct: float) -> str:
+    """Formatted percent label; common values recur across bar renders"""
+    return f"{pct:.1f}%"
+
+
+@lru_cache(maxsize=4096)
+def _sample_text(sample: int, sample_type: str) -> str:
+    """Sample-size suffix for vote-block titles, cached per count"""
+    if sample <= 0:
+        return "(No data)"
+    if sample < LOW_SAMPLE_THRESHOLD:
+        return f"(⚠ {sample} {sample_type})"
+    return f"({sample} {sample_type})"
+
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _valid_date(s: str) -> bool:
+    """Validate a YYYY-MM-DD date; regex fast path, strptime fallback"""
+    if _DATE_RE.match(s):
+        y, m, d = int(s[:4]), int(s[5:7]), int(s[8:10])
+        if y < 1 or not 1 <= m <= 12:
+            return False
+        days = _DAYS_IN_MONTH[m - 1]
+        if m == 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+            days = 29
+        return 1 <= d <= days
+    # Unpadded dates ("2026-8-5") were accepted before the fast path
+    # existed; keep accepting them via the slow parser
+    try:
+        datetime.strptime(s, "%Y-%m-%d")
+        return True
+    except ValueError:
+        return False
+
+
+# Keys that never change the combobox text; checked per keystroke
+_SEARCH_IGNORE_KEYS = frozenset((
+    'Up', 'Down', 'Left', 'Right', 'Return', 'Tab', 'Escape',
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R',
+))
+
+# Suggestion cap while typing; the full list stays a dropdown-click away
+_SEARCH_MAX_RESULTS = 20
+
+
 def make_combobox_searchable(combobox: ttk.Combobox, all_values: list):
     """Make a Combobox searchable by filtering options as user types"""
-    
-    def on_keyrelease(event):
-        # Ignore special keys
-        if event.keysym in ('Up', 'Down', 'Left', 'Right', 'Return', 'Tab', 'Escape', 'Shift_L', 'Shift_R', 'Control_L', 'Control_R'):
-            return
-        
+    # Sort by lowercase once so prefix matches come from a bisect slice
+    # instead of a full scan; keeps original strings alongside
+    lower_pairs = sorted((v.lower(), v) for v in all_values)
+    sorted_lower = [lv for lv, _ in lower_pairs]
+    pending = [None]  # debounce handle; fast typing coalesces to one filter
+
+    def matches_for(typed: str) -> list:
+        # Prefix hits first (bisect range), substring hits fill the rest
+        out = []
+        i = bisect_left(sorted_lower, typed)
+        while (i < len(sorted_lower) and len(out) < _SEARCH_MAX_RESULTS
+               and sorted_lower[i].startswith(typed)):
+            out.append(lower_pairs[i][1])
+            i += 1
+        if len(out) < _SEARCH_MAX_RESULTS:
+            for lv, v in lower_pairs:
+                if typed in lv and not lv.startswith(typed):
+                    out.append(v)
+                    if len(out) >= _SEARCH_MAX_RESULTS:
+                        break
+        return out
+
+    def apply_filter():
+        pending[0] = None
         typed = combobox.get().lower()
         if not typed:
             # Show all values if empty
             combobox['values'] = all_values
         else:
-            # Filter values that contain the typed text
-            filtered = [v for v in all_values if typed in v.lower()]
-            combobox['values'] = filtered
-        
+            combobox['values'] = matches_for(typed)
+
         # Don't auto-open dropdown - let user open it when ready
-    
+
+    def on_keyrelease(event):
+        # Ignore special keys
+        if event.keysym in _SEARCH_IGNORE_KEYS:
+            return
+        if pending[0] is not None:
+            combobox.after_cancel(pending[0])
+        pending[0] = combobox.after(50, apply_filter)
+
+    def ensure_values():
+        # Materialize the full Tcl list only when the dropdown is opened
+        # with no filter text, not at widget-build time
+        if not combobox.get():
+            combobox['values'] = all_values
+
     combobox.bind('<KeyRelease>', on_keyrelease)
-    combobox['values'] = all_values
+    combobox.configure(postcommand=ensure_values)
+    combobox['values'] = ()
 
 
 # -----------------------------
@@ -117,7 +251,7 @@ def new_id() -> str:
 # -----------------------------
 # Sort & Filter Config
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class SortConfig:
     """Sort configuration with priority levels"""
     dimensions: List[Tuple[str, str]] = field(default_factory=list)  # [(dimension, order), ...]
@@ -125,7 +259,7 @@ class SortConfig:
     # order: "asc", "desc", "female_first", "male_first", "unisex_first", etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterConfig:
     """Filter configuration"""
     brands: List[str] = field(default_factory=list)
@@ -153,8 +287,19 @@ class FilterConfig:
     has_my_vote: bool = False
     has_fragrantica: bool = False
 
+    def cache_key(self) -> tuple:
+        """Hashable snapshot of the whole config, for memoization"""
+        return (tuple(self.brands), tuple(self.concentrations), tuple(self.locations),
+                tuple(self.states), tuple(self.seasons), tuple(self.times),
+                self.rating_min, self.rating_max, self.rating_exclude,
+                self.longevity_min, self.longevity_max, self.longevity_exclude,
+                self.sillage_min, self.sillage_max, self.sillage_exclude,
+                self.value_min, self.value_max, self.value_exclude,
+                tuple(self.gender_preference), tuple(self.tags), self.tags_logic,
+                self.has_my_vote, self.has_fragrantica)
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
     id: str
     perfume_id: str
@@ -169,7 +314,7 @@ class Event:
     event_date: str = ""  # User-specified date (YYYY-MM-DD, optional)
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """A note with title and content"""
     id: str
@@ -192,7 +337,7 @@ def get_label_from_url(url: str) -> str:
         return url
 
 
-@dataclass
+@dataclass(slots=True)
 class Perfume:
     id: str
     name: str
@@ -205,7 +350,11 @@ class Perfume:
     created_at: int = field(default_factory=now_ts)
     updated_at: int = field(default_factory=now_ts)
 
-    events: List[Event] = field(default_factory=list)
+    # Events stay as the raw JSON dicts they were loaded as until the
+    # first .events access builds the Event objects; the list view only
+    # needs aggregates, which derive_state reads straight off the dicts
+    _events_raw: List[Dict] = field(default_factory=list, repr=False, compare=False)
+    _events: Optional[List[Event]] = field(default=None, repr=False, compare=False)
 
     notes: List[Note] = field(default_factory=list)  # List of Note objects
     links: List[Dict] = field(default_factory=list)  # [{"label": "...", "url": "..."}, ...]
@@ -216,18 +365,47 @@ class Perfume:
     # Personal vote counts aligned with Fragrantica options (optional blocks)
     my_votes: Dict = field(default_factory=dict)
 
+    # Runtime-only cache of derived block scores (never persisted);
+    # cleared whenever fragrantica data changes
+    _score_cache: Dict = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def events(self) -> List[Event]:
+        if self._events is None:
+            self._events = [Event(**e) for e in self._events_raw]
+            self._events_raw = []  # Event objects are authoritative from here on
+        return self._events
+
+    @events.setter
+    def events(self, value: List[Event]):
+        self._events = list(value)
+        self._events_raw = []
+
+    def iter_events_compact(self):
+        """
+        Yield (event_type, ml_delta, purchase_type, note) per event from
+        whichever representation is live, so aggregate passes such as
+        derive_state never force Event construction.
+        """
+        if self._events is not None:
+            for e in self._events:
+                yield e.event_type, e.ml_delta, e.purchase_type, e.note
+        else:
+            for e in self._events_raw:
+                yield e.get("event_type"), e.get("ml_delta"), e.get("purchase_type"), e.get("note")
+
 
 # -----------------------------
 # V2 Data Structures (ID-based)
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class OutletInfo:
     """Location info for testing fragrances"""
     name: str          # e.g., "Sephora", "Nordstrom"
     region: str = ""   # e.g., "NYC", "LA", or leave empty
 
 
-@dataclass
+@dataclass(slots=True)
 class AppData:
     """Complete app data: perfumes + all mapping tables"""
     perfumes: List[Perfume] = field(default_factory=list)
@@ -397,8 +575,116 @@ class LabelTooltip:
 # -----------------------------
 # Persistence
 # -----------------------------
+_DIRS_READY = False
+
+
 def ensure_dirs():
+    # Called on every save; skip the makedirs stat once it has succeeded
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
     os.makedirs(DATA_DIR, exist_ok=True)
+    _DIRS_READY = True
+
+
+# Field-name tuples for the serializers below, resolved once at import.
+# Unlike dataclasses.asdict these flatteners do not deep-copy nested
+# containers (links/fragrantica/my_votes are already JSON-shaped), so a
+# save no longer allocates a full mirror of the library.
+_EVENT_FIELDS = tuple(f.name for f in fields(Event))
+_NOTE_FIELDS = tuple(f.name for f in fields(Note))
+# Underscore fields are runtime-only caches and never persisted; the
+# raw-event stash serializes under its public name so the JSON key
+# order is unchanged
+_PERFUME_FIELDS = tuple(
+    "events" if f.name == "_events_raw" else f.name
+    for f in fields(Perfume)
+    if f.name == "_events_raw" or not f.name.startswith("_")
+)
+
+
+def _event_to_dict(e: Event) -> Dict:
+    return {k: getattr(e, k) for k in _EVENT_FIELDS}
+
+
+def _note_to_dict(n: Note) -> Dict:
+    return {k: getattr(n, k) for k in _NOTE_FIELDS}
+
+
+def _perfume_to_dict(p: Perfume) -> Dict:
+    d = {}
+    for k in _PERFUME_FIELDS:
+        if k == "events":
+            # Unmaterialized events are still the JSON-shaped dicts they
+            # were loaded as; pass them straight through
+            ev = p._events
+            d[k] = p._events_raw if ev is None else [_event_to_dict(e) for e in ev]
+        elif k == "notes":
+            d[k] = [_note_to_dict(n) for n in p.notes]
+        else:
+            d[k] = getattr(p, k)
+    return d
+
+
+def _outlet_to_dict(o: OutletInfo) -> Dict:
+    return {"name": o.name, "region": o.region}
+
+
+def _intern_event_fields(e: Dict) -> Dict:
+    """
+    Intern the heavily-duplicated event strings ("smell"/"skin",
+    purchase type names and ids) so later equality checks compare by
+    pointer and the heap holds one copy of each.
+    """
+    for k in ("event_type", "purchase_type", "purchase_type_id"):
+        v = e.get(k)
+        if v:
+            e[k] = sys.intern(v)
+    return e
+
+
+def _sanitize_vote_blocks(container: Dict) -> Dict:
+    """
+    Coerce every count in the *_votes sub-dicts to a real int once at
+    load, so the scoring loops can use bare votes.get(k, 0) instead of
+    re-guarding against None/str on every access. Metadata keys (url,
+    source, last_updated) are left alone.
+    """
+    for key, block in container.items():
+        if key.endswith("_votes") and isinstance(block, dict):
+            for k, v in block.items():
+                if type(v) is not int:
+                    block[k] = int(v) if v else 0
+    return container
+
+
+def _read_json(path) -> Optional[Dict]:
+    """Read a JSON file as bytes; returns None if empty. Uses orjson when present."""
+    with open(path, "rb") as f:
+        content = f.read()
+    if not content.strip():
+        return None
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _write_json(path, data: Dict):
+    """
+    Write JSON with 2-space indent; orjson encodes to UTF-8 bytes in C.
+
+    Writes to a sibling .tmp file and swaps it in with os.replace, so a
+    crash mid-write never leaves a torn database — the old file stays
+    intact until the new one is fully on disk.
+    """
+    tmp = path + ".tmp"
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
 
 
 def load_db() -> List[Perfume]:
@@ -406,12 +692,10 @@ def load_db() -> List[Perfume]:
     if not os.path.exists(DB_PATH):
         return []
 
-    with open(DB_PATH, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = _read_json(DB_PATH) or {}
 
     perfumes: List[Perfume] = []
     for p in raw.get("perfumes", []):
-        events = [Event(**e) for e in p.get("events", [])]
         notes = [Note(**n) for n in p.get("notes", [])]
         perfume = Perfume(
             id=p["id"],
@@ -420,7 +704,7 @@ def load_db() -> List[Perfume]:
             tags=p.get("tags", []),
             created_at=p.get("created_at", now_ts()),
             updated_at=p.get("updated_at", now_ts()),
-            events=events,
+            _events_raw=p.get("events", []),
             notes=notes,
             fragrantica=p.get("fragrantica", {}),
             my_votes=p.get("my_votes", {}),
@@ -437,16 +721,8 @@ def load_db() -> List[Perfume]:
 
 def save_db(perfumes: List[Perfume]):
     ensure_dirs()
-
-    def perfume_to_dict(p: Perfume) -> Dict:
-        d = asdict(p)
-        d["events"] = [asdict(e) for e in p.events]
-        d["notes"] = [asdict(n) for n in p.notes]
-        return d
-
-    data = {"version": 2, "updated_at": now_ts(), "perfumes": [perfume_to_dict(p) for p in perfumes]}
-    with open(DB_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    data = {"version": 2, "updated_at": now_ts(), "perfumes": [_perfume_to_dict(p) for p in perfumes]}
+    _write_json(DB_PATH, data)
 
 
 # -----------------------------
@@ -467,27 +743,26 @@ def load_app_data() -> AppData:
             app_data.note_titles_map[new_id()] = title
         return app_data
 
-    with open(DB_PATH, "r", encoding="utf-8") as f:
-        content = f.read().strip()
-        if not content:
-            # Empty file - return default
-            app_data = AppData()
-            for conc in DEFAULT_CONCENTRATIONS:
-                app_data.concentrations_map[new_id()] = conc
-            for pt in DEFAULT_PURCHASE_TYPES:
-                app_data.purchase_types_map[new_id()] = pt
-            for title in DEFAULT_NOTE_TITLES:
-                app_data.note_titles_map[new_id()] = title
-            return app_data
-        raw = json.loads(content)
+    raw = _read_json(DB_PATH)
+    if raw is None:
+        # Empty file - return default
+        app_data = AppData()
+        for conc in DEFAULT_CONCENTRATIONS:
+            app_data.concentrations_map[new_id()] = conc
+        for pt in DEFAULT_PURCHASE_TYPES:
+            app_data.purchase_types_map[new_id()] = pt
+        for title in DEFAULT_NOTE_TITLES:
+            app_data.note_titles_map[new_id()] = title
+        return app_data
 
     app_data = AppData()
-    
-    # Load mapping tables (if exist)
-    app_data.brands_map = raw.get("brands_map", {})
-    app_data.concentrations_map = raw.get("concentrations_map", {})
-    app_data.tags_map = raw.get("tags_map", {})
-    app_data.purchase_types_map = raw.get("purchase_types_map", {})
+
+    # Load mapping tables (if exist); intern ids so the per-perfume
+    # references below share the same key objects
+    app_data.brands_map = {sys.intern(k): v for k, v in raw.get("brands_map", {}).items()}
+    app_data.concentrations_map = {sys.intern(k): v for k, v in raw.get("concentrations_map", {}).items()}
+    app_data.tags_map = {sys.intern(k): v for k, v in raw.get("tags_map", {}).items()}
+    app_data.purchase_types_map = {sys.intern(k): v for k, v in raw.get("purchase_types_map", {}).items()}
     app_data.note_titles_map = raw.get("note_titles_map", {})
     
     # Load sort modes (with defaults)
@@ -505,6 +780,7 @@ def load_app_data() -> AppData:
     
     # Load outlets_map (needs special handling for OutletInfo)
     for oid, oinfo in raw.get("outlets_map", {}).items():
+        oid = sys.intern(oid)
         if isinstance(oinfo, dict):
             app_data.outlets_map[oid] = OutletInfo(
                 name=oinfo.get("name", ""),
@@ -516,22 +792,22 @@ def load_app_data() -> AppData:
     # Load perfumes (V2: no brand/tags string fields)
     raw_perfumes = raw.get("perfumes", [])
     for p_raw in raw_perfumes:
-        events = [Event(**e) for e in p_raw.get("events", [])]
+        events_raw = [_intern_event_fields(e) for e in p_raw.get("events", [])]
         notes = [Note(**n) for n in p_raw.get("notes", [])]
         perfume = Perfume(
             id=p_raw["id"],
             name=p_raw.get("name", ""),
-            brand_id=p_raw.get("brand_id", ""),
-            concentration_id=p_raw.get("concentration_id", ""),
-            outlet_ids=p_raw.get("outlet_ids", []),
-            tag_ids=p_raw.get("tag_ids", []),
+            brand_id=sys.intern(p_raw.get("brand_id", "")),
+            concentration_id=sys.intern(p_raw.get("concentration_id", "")),
+            outlet_ids=[sys.intern(x) for x in p_raw.get("outlet_ids", [])],
+            tag_ids=[sys.intern(x) for x in p_raw.get("tag_ids", [])],
             created_at=p_raw.get("created_at", now_ts()),
             updated_at=p_raw.get("updated_at", now_ts()),
-            events=events,
+            _events_raw=events_raw,
             notes=notes,
             links=p_raw.get("links", []),
-            fragrantica=p_raw.get("fragrantica", {}),
-            my_votes=p_raw.get("my_votes", {}),
+            fragrantica=_sanitize_vote_blocks(p_raw.get("fragrantica", {})),
+            my_votes=_sanitize_vote_blocks(p_raw.get("my_votes", {})),
         )
         app_data.perfumes.append(perfume)
     
@@ -582,28 +858,19 @@ def load_app_data() -> AppData:
     return app_data
 
 
-def save_app_data(app_data: AppData):
-    """Save complete app data including mapping tables"""
-    ensure_dirs()
-    
-    # V2: brand and tags are now ID-based only, no auto-fix needed
-
-    def perfume_to_dict(p: Perfume) -> Dict:
-        d = asdict(p)
-        d["events"] = [asdict(e) for e in p.events]
-        d["notes"] = [asdict(n) for n in p.notes]
-        return d
-    
-    def outlet_to_dict(o: OutletInfo) -> Dict:
-        return {"name": o.name, "region": o.region}
-
+def _serialize_app_data(app_data: AppData) -> bytes:
+    """
+    Encode the full app data to JSON bytes. Runs on the caller's thread
+    so the snapshot is consistent — mutating the app data afterwards
+    cannot change what gets written.
+    """
     data = {
         "version": 2,
         "updated_at": now_ts(),
-        "perfumes": [perfume_to_dict(p) for p in app_data.perfumes],
+        "perfumes": [_perfume_to_dict(p) for p in app_data.perfumes],
         "brands_map": app_data.brands_map,
         "concentrations_map": app_data.concentrations_map,
-        "outlets_map": {oid: outlet_to_dict(o) for oid, o in app_data.outlets_map.items()},
+        "outlets_map": {oid: _outlet_to_dict(o) for oid, o in app_data.outlets_map.items()},
         "tags_map": app_data.tags_map,
         "purchase_types_map": app_data.purchase_types_map,
         "note_titles_map": app_data.note_titles_map,
@@ -611,9 +878,79 @@ def save_app_data(app_data: AppData):
         "font_size": app_data.font_size,
         "owned_ml_include_formats": app_data.owned_ml_include_formats,
     }
-    
-    with open(DB_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_bytes(path, payload: bytes):
+    """Atomic byte write: temp file + os.replace (same as _write_json)."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+def save_app_data(app_data: AppData):
+    """Save complete app data including mapping tables (synchronous)"""
+    ensure_dirs()
+
+    # V2: brand and tags are now ID-based only, no auto-fix needed
+
+    _write_bytes(DB_PATH, _serialize_app_data(app_data))
+
+
+# Background writer: the UI thread serializes a snapshot and hands the
+# bytes over; the worker only does file I/O, so the main loop never
+# blocks on disk. The queue holds at most one pending snapshot — a newer
+# one simply replaces a stale one that has not been written yet.
+_save_queue: "queue.Queue[bytes]" = queue.Queue(maxsize=1)
+_save_thread: Optional[threading.Thread] = None
+_last_save_error: Optional[OSError] = None  # set by the worker, read on close
+
+
+def _save_worker():
+    global _last_save_error
+    while True:
+        payload = _save_queue.get()
+        try:
+            _write_bytes(DB_PATH, payload)
+            _last_save_error = None
+        except OSError as e:
+            # Keep the worker alive, but remember the failure so the UI
+            # can surface it instead of dropping the snapshot silently
+            _last_save_error = e
+        _save_queue.task_done()
+
+
+def queue_save(app_data: AppData):
+    """Serialize on the caller's thread, write on the background worker."""
+    global _save_thread
+    ensure_dirs()
+    if _save_thread is None:
+        _save_thread = threading.Thread(target=_save_worker, daemon=True, name="db-writer")
+        _save_thread.start()
+    payload = _serialize_app_data(app_data)
+    while True:
+        try:
+            _save_queue.put_nowait(payload)
+            return
+        except queue.Full:
+            try:
+                _save_queue.get_nowait()  # drop the stale snapshot
+                _save_queue.task_done()
+            except queue.Empty:
+                pass
+
+
+def flush_saves() -> bool:
+    """
+    Block until every queued snapshot has been attempted; returns False
+    if the most recent disk write failed.
+    """
+    if _save_thread is not None:
+        _save_queue.join()
+    return _last_save_error is None
 
 
 # -----------------------------
@@ -631,18 +968,25 @@ def derive_state(p: Perfume, tag_names: List[str] = None, included_purchase_type
     
     included_purchase_types: if provided, only events with this purchase_type name count toward owned_ml.
     """
-    tested = any(e.event_type in ("smell", "skin") for e in p.events)
-    on_skin = any(e.event_type == "skin" for e in p.events)
+    # One pass over the events computes all four aggregates; the compact
+    # iterator reads raw dicts when the Event objects were never built
+    tested = on_skin = want = False
     owned_ml = 0.0
     included = set(included_purchase_types) if included_purchase_types is not None else None
-    for e in p.events:
-        if e.ml_delta is not None:
-            if included is None or (e.purchase_type or "").strip() in included:
-                owned_ml += float(e.ml_delta)
+    for et, ml_delta, purchase_type, note in p.iter_events_compact():
+        if et == "skin":
+            tested = on_skin = True
+        elif et == "smell":
+            tested = True
+        if ml_delta is not None:
+            if included is None or (purchase_type or "").strip() in included:
+                owned_ml += float(ml_delta)
+        if not want and note and "want" in note.lower():
+            want = True
 
     # V2: Use tag_names parameter (required for want detection)
-    tags_to_check = tag_names if tag_names is not None else []
-    want = ("want" in [t.lower() for t in tags_to_check]) or any(("want" in (e.note or "").lower()) for e in p.events)
+    if not want and tag_names:
+        want = any(t.lower() == "want" for t in tag_names)
 
     parts = []
     if tested:
@@ -663,93 +1007,112 @@ def derive_state(p: Perfume, tag_names: List[str] = None, included_purchase_type
 # -----------------------------
 # Vote summary calculations
 # -----------------------------
+# Per-block weight tuples, precomputed once. Rating keys run best-to-
+# worst so its weights descend; every other block is 1..N in key order.
+RATING_WEIGHTS = (5, 4, 3, 2, 1)
+LONGEVITY_WEIGHTS = (1, 2, 3, 4, 5)
+SILLAGE_WEIGHTS = (1, 2, 3, 4)
+GENDER_WEIGHTS = (1, 2, 3, 4, 5)
+VALUE_WEIGHTS = tuple(range(1, len(VALUE_5) + 1))
+
+_BLOCK_WEIGHTS = {
+    "rating_votes": RATING_WEIGHTS,
+    "longevity_votes": LONGEVITY_WEIGHTS,
+    "sillage_votes": SILLAGE_WEIGHTS,
+    "gender_votes": GENDER_WEIGHTS,
+    "value_votes": VALUE_WEIGHTS,
+}
+
+
+def _weighted_mean(votes: Dict[str, int], keys: List[str], weights: Tuple[int, ...]) -> float:
+    """
+    One-pass weighted mean of vote counts. Returns 0.0 when there are no
+    votes — a real mean is always >= 1.
+    """
+    if not votes:
+        return 0.0
+    total = 0
+    weighted = 0
+    for k, w in zip(keys, weights):
+        v = votes.get(k, 0)
+        total += v
+        weighted += v * w
+    return weighted / total if total else 0.0
+
+
 def calculate_rating_summary(votes: Dict[str, int], keys: List[str]) -> str:
     """Calculate weighted average for Rating: love=5, like=4, ok=3, dislike=2, hate=1"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
-        return "—"
-    
-    weights = {keys[0]: 5, keys[1]: 4, keys[2]: 3, keys[3]: 2, keys[4]: 1}  # love to hate
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    score = weighted_sum / total
-    return f"{score:.2f}"
+    score = _weighted_mean(votes, keys, RATING_WEIGHTS)
+    return f"{score:.2f}" if score else "—"
+
+
+# Season/time classification for calculate_when_summary: one bit per
+# option, with the summary text for every possible mask precomputed
+# (year-round / "except X" / joined labels, in SEASON_TIME_6 order).
+_SEASON_KEYS = ("spring", "summer", "fall", "winter")
+_SEASON_BITS = {k: 1 << i for i, k in enumerate(_SEASON_KEYS)}
+_TIME_BITS = {"day": 1, "night": 2}
+
+
+def _season_mask_text(mask: int) -> str:
+    present = [k for i, k in enumerate(_SEASON_KEYS) if mask >> i & 1]
+    if len(present) == 4:
+        return "year-round"
+    if len(present) == 3:
+        missing = next(k for k in _SEASON_KEYS if k not in present)
+        return f"except {display_label(missing)}"
+    return ", ".join(display_label(s) for s in present)
+
+
+_SEASON_TEXT = tuple(_season_mask_text(m) for m in range(16))
+_TIME_TEXT = ("", "day", "night", "anytime")
 
 
 def calculate_when_summary(votes: Dict[str, int], keys: List[str]) -> str:
     """Show top options with smart abbreviation"""
     if not votes or all(v == 0 for v in votes.values()):
         return "—"
-    
-    max_votes = max(int(votes.get(k, 0) or 0) for k in keys)
+
+    max_votes = max(votes.get(k, 0) for k in keys)
     if max_votes == 0:
         return "—"
-    
+
+    # Single pass: set one bit per top option, then index the
+    # precomputed summary tables
     threshold = max_votes * 0.6
-    top_options = [k for k in keys if int(votes.get(k, 0) or 0) >= threshold]
-    
-    if not top_options:
-        return "—"
-    
-    # Separate seasons and times
-    all_seasons = ["spring", "summer", "fall", "winter"]
-    seasons = [opt for opt in top_options if opt in all_seasons]
-    times = [opt for opt in top_options if opt in ["day", "night"]]
-    
+    season_mask = 0
+    time_mask = 0
+    for k in keys:
+        if votes.get(k, 0) >= threshold:
+            season_mask |= _SEASON_BITS.get(k, 0)
+            time_mask |= _TIME_BITS.get(k, 0)
+
     parts = []
-    
-    # Smart season abbreviation
-    if len(seasons) == 4:
-        parts.append("year-round")
-    elif len(seasons) == 3:
-        # Find the missing season and use "except"
-        missing = [s for s in all_seasons if s not in seasons][0]
-        parts.append(f"except {display_label(missing)}")
-    elif seasons:
-        parts.append(", ".join(display_label(s) for s in seasons))
-    
-    # Smart time abbreviation
-    if len(times) == 2:
-        parts.append("anytime")
-    elif times:
-        parts.append(", ".join(display_label(t) for t in times))
-    
+    if season_mask:
+        parts.append(_SEASON_TEXT[season_mask])
+    if time_mask:
+        parts.append(_TIME_TEXT[time_mask])
     return " | ".join(parts) if parts else "—"
 
 
 def calculate_longevity_summary(votes: Dict[str, int], keys: List[str]) -> str:
     """Calculate weighted average: poor=1 to enormous=5"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
-        return "—"
-    
-    weights = {keys[i]: i+1 for i in range(len(keys))}  # 1 to 5
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    score = weighted_sum / total
-    return f"{score:.2f}"
+    score = _weighted_mean(votes, keys, LONGEVITY_WEIGHTS)
+    return f"{score:.2f}" if score else "—"
 
 
 def calculate_sillage_summary(votes: Dict[str, int], keys: List[str]) -> str:
     """Calculate weighted average: intimate=1 to enormous=4"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
-        return "—"
-    
-    weights = {keys[i]: i+1 for i in range(len(keys))}  # 1 to 4
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    score = weighted_sum / total
-    return f"{score:.2f}"
+    score = _weighted_mean(votes, keys, SILLAGE_WEIGHTS)
+    return f"{score:.2f}" if score else "—"
 
 
 def calculate_gender_summary(votes: Dict[str, int], keys: List[str]) -> str:
     """Calculate weighted average and map to nearest option"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
+    score = _weighted_mean(votes, keys, GENDER_WEIGHTS)
+    if not score:
         return "—"
-    
-    weights = {keys[i]: i+1 for i in range(len(keys))}  # 1 to 5
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    score = weighted_sum / total
-    
+
     # Map to nearest option
     index = round(score - 1)  # score 1-5 → index 0-4
     index = max(0, min(len(keys)-1, index))  # clamp
@@ -758,14 +1121,10 @@ def calculate_gender_summary(votes: Dict[str, int], keys: List[str]) -> str:
 
 def calculate_value_summary(votes: Dict[str, int], keys: List[str]) -> str:
     """Calculate weighted average and map to nearest option (dynamic)"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
+    score = _weighted_mean(votes, keys, VALUE_WEIGHTS)
+    if not score:
         return "—"
-    
-    weights = {keys[i]: i+1 for i in range(len(keys))}  # dynamic 1 to N
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    score = weighted_sum / total
-    
+
     # Map to nearest option
     index = round(score - 1)
     index = max(0, min(len(keys)-1, index))
@@ -777,69 +1136,191 @@ def calculate_value_summary(votes: Dict[str, int], keys: List[str]) -> str:
 # -----------------------------
 def calculate_rating_score(votes: Dict[str, int], keys: List[str]) -> float:
     """Calculate rating score: love=5, like=4, ok=3, dislike=2, hate=1"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
-        return 0.0
-    weights = {keys[0]: 5, keys[1]: 4, keys[2]: 3, keys[3]: 2, keys[4]: 1}
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    return weighted_sum / total
+    return _weighted_mean(votes, keys, RATING_WEIGHTS)
 
 
 def calculate_longevity_score(votes: Dict[str, int], keys: List[str]) -> float:
     """Calculate longevity score: 1 to 5"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
-        return 0.0
-    weights = {keys[i]: i+1 for i in range(len(keys))}
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    return weighted_sum / total
+    return _weighted_mean(votes, keys, LONGEVITY_WEIGHTS)
 
 
 def calculate_sillage_score(votes: Dict[str, int], keys: List[str]) -> float:
     """Calculate sillage score: 1 to 4"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
-        return 0.0
-    weights = {keys[i]: i+1 for i in range(len(keys))}
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    return weighted_sum / total
+    return _weighted_mean(votes, keys, SILLAGE_WEIGHTS)
 
 
 def calculate_gender_score(votes: Dict[str, int], keys: List[str]) -> float:
     """Calculate gender score: 1 to 5 (female to male)"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
-        return 0.0
-    weights = {keys[i]: i+1 for i in range(len(keys))}
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    return weighted_sum / total
+    return _weighted_mean(votes, keys, GENDER_WEIGHTS)
 
 
 def calculate_value_score(votes: Dict[str, int], keys: List[str]) -> float:
     """Calculate value score: 1 to N (dynamic)"""
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
-    if total == 0:
-        return 0.0
-    weights = {keys[i]: i+1 for i in range(len(keys))}
-    weighted_sum = sum(int(votes.get(k, 0) or 0) * weights[k] for k in keys)
-    return weighted_sum / total
+    return _weighted_mean(votes, keys, VALUE_WEIGHTS)
+
+
+def get_fragrantica_score(p: Perfume, block: str, keys: List[str]) -> float:
+    """
+    Weighted score for a perfume's Fragrantica vote block, cached on the
+    perfume. Fragrantica data changes rarely, so sort/filter passes hit
+    the cache instead of re-walking vote dicts per comparison; mutators
+    clear p._score_cache.
+    """
+    score = p._score_cache.get(block)
+    if score is None:
+        votes = (p.fragrantica or {}).get(block, {})
+        score = _weighted_mean(votes, keys, _BLOCK_WEIGHTS[block])
+        p._score_cache[block] = score
+    return score
+
+
+def build_vote_matrix(perfumes: List[Perfume], block: str, keys: List[str]):
+    """
+    Pack one Fragrantica vote block into an (N, K) count matrix plus its
+    weight vector (descending for rating, whose keys run best-to-worst).
+    The matrix is stored at the narrowest unsigned dtype the counts fit
+    (uint8 -> uint16 -> int64), so typical blocks are 8x smaller in
+    cache than an int64 layout; the reduction widens in registers, not
+    in storage. Requires numpy.
+    """
+    n_keys = len(keys)
+    V = np.zeros((len(perfumes), n_keys), dtype=np.int64)
+    for i, p in enumerate(perfumes):
+        votes = (p.fragrantica or {}).get(block)
+        if votes:
+            for j, k in enumerate(keys):
+                V[i, j] = votes.get(k, 0)
+    peak = int(V.max(initial=0))
+    if peak <= 255:
+        V = V.astype(np.uint8)
+    elif peak <= 65535:
+        V = V.astype(np.uint16)
+    return V, np.asarray(_BLOCK_WEIGHTS[block], dtype=np.float64)
+
+
+if _njit is not None:
+
+    @_njit(parallel=True, cache=True)
+    def _batch_scores_kernel(V, W):
+        """Row-wise weighted mean of the vote matrix, parallel over perfumes."""
+        n = V.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        for i in _prange(n):
+            s = 0.0
+            t = 0
+            for j in range(V.shape[1]):
+                v = V[i, j]
+                t += v
+                s += v * W[j]
+            out[i] = s / t if t > 0 else 0.0
+        return out
+
+
+def batch_block_scores(perfumes: List[Perfume], block: str, keys: List[str]):
+    """
+    Weighted scores for one vote block across all perfumes in a single
+    C-level reduction instead of a Python loop per perfume: a compiled
+    numba kernel when available (parallel across rows), else one matrix
+    multiply + guarded division in numpy. Falls back to the cached
+    scalar path without numpy; 0.0 still means 'no votes'.
+    """
+    if np is None:
+        return [get_fragrantica_score(p, block, keys) for p in perfumes]
+    V, weights = build_vote_matrix(perfumes, block, keys)
+    if _njit is not None:
+        return _batch_scores_kernel(V, weights)
+    totals = V.sum(axis=1)
+    weighted = V.astype(np.float64) @ weights
+    return np.where(totals > 0, weighted / np.maximum(totals, 1), 0.0)
+
+
+def batch_normalize(votes_list: List[Dict[str, int]], keys: List[str], mode: str):
+    """
+    Normalize many vote blocks at once: one (M, K) array divide instead
+    of M small Python loops. mode follows normalize_votes_* ("max"
+    normalizes against the row max, anything else against the row sum);
+    rows with no votes come back as zeros, matching the scalar
+    functions. Falls back to the per-dict path without numpy.
+    """
+    if np is None:
+        fn = normalize_votes_max if mode == "max" else normalize_votes_sum
+        return [fn(v, keys) for v in votes_list]
+    arr = np.zeros((len(votes_list), len(keys)), dtype=np.float64)
+    for i, votes in enumerate(votes_list):
+        if votes:
+            for j, k in enumerate(keys):
+                arr[i, j] = votes.get(k, 0)
+    denom = arr.max(axis=1) if mode == "max" else arr.sum(axis=1)
+    fractions = arr / np.where(denom > 0, denom, 1.0)[:, None]
+    return fractions.tolist()
+
+
+class PerfumeSoA:
+    """
+    Structure-of-arrays view over a perfume list: one float64 score
+    array per vote block, aligned by index with the source list. The
+    score-range filters can then run as boolean vector compares instead
+    of per-object attribute walks; the Perfume objects stay
+    authoritative for everything else. Scores come through the cached
+    accessor, so rebuilding after the first pass is just dict lookups.
+    Only built when numpy is available — callers skip the SoA path
+    otherwise.
+    """
+
+    _BLOCKS = (
+        ("rating", "rating_votes", RATING_5, 5.0),
+        ("longevity", "longevity_votes", LONGEVITY_5, 5.0),
+        ("sillage", "sillage_votes", SILLAGE_4, 4.0),
+        ("value", "value_votes", VALUE_5, 5.0),
+    )
+
+    def __init__(self, perfumes: List[Perfume]):
+        self.scores = {
+            name: np.array([get_fragrantica_score(p, block, keys) for p in perfumes])
+            for name, block, keys, _ in self._BLOCKS
+        }
+
+    def filter_mask(self, config: FilterConfig):
+        """
+        Combined boolean mask for the active score-range filters, or
+        None when no score filter is active. Mirrors the per-block
+        logic in _matches_filter: include mode keeps in-range perfumes
+        that have data, exclude mode drops them.
+        """
+        mask = None
+        for name, _, _, top in self._BLOCKS:
+            lo = getattr(config, name + "_min")
+            hi = getattr(config, name + "_max")
+            exclude = getattr(config, name + "_exclude")
+            if not (lo > 0 or hi < top or exclude):
+                continue
+            s = self.scores[name]
+            hit = (s > 0) & (s >= lo) & (s <= hi)
+            if exclude:
+                hit = ~hit
+            mask = hit if mask is None else (mask & hit)
+        return mask
 
 
 # -----------------------------
 # Vote normalization (display-time only)
 # -----------------------------
 def normalize_votes_sum(votes: Dict[str, int], keys: List[str]) -> List[float]:
-    total = sum(int(votes.get(k, 0) or 0) for k in keys)
+    if not votes:
+        return [0.0] * len(keys)
+    total = sum(votes.get(k, 0) for k in keys)
     if total <= 0:
         return [0.0] * len(keys)
-    return [(int(votes.get(k, 0) or 0) / total) for k in keys]
+    return [(votes.get(k, 0) / total) for k in keys]
 
 
 def normalize_votes_max(votes: Dict[str, int], keys: List[str]) -> List[float]:
-    mx = max((int(votes.get(k, 0) or 0) for k in keys), default=0)
+    if not votes:
+        return [0.0] * len(keys)
+    mx = max((votes.get(k, 0) for k in keys), default=0)
     if mx <= 0:
         return [0.0] * len(keys)
-    return [(int(votes.get(k, 0) or 0) / mx) for k in keys]
+    return [(votes.get(k, 0) / mx) for k in keys]
 
 
 def sample_size_for_block(votes: Dict[str, int], keys: List[str], mode: str) -> int:
@@ -847,9 +1328,11 @@ def sample_size_for_block(votes: Dict[str, int], keys: List[str], mode: str) ->
     For sum-normalized blocks: sample size = sum
     For max-normalized season_time: sample size = max (commonly indicates strongest signal)
     """
+    if not votes:
+        return 0
     if mode == "max":
-        return max((int(votes.get(k, 0) or 0) for k in keys), default=0)
-    return sum((int(votes.get(k, 0) or 0) for k in keys), 0)
+        return max((votes.get(k, 0) for k in keys), default=0)
+    return sum((votes.get(k, 0) for k in keys), 0)
 
 
 # -----------------------------
@@ -875,12 +1358,27 @@ class RangeSlider(tk.Canvas):
         self.track_padding = 15
         
         self.dragging = None  # "min", "max", or None
-        
+        self._pending_drag_x = None  # latest drag position awaiting an idle redraw
+
         self.bind("<Button-1>", self._on_click)
         self.bind("<B1-Motion>", self._on_drag)
         self.bind("<ButtonRelease-1>", self._on_release)
-        
-        self._draw()
+
+        # Create the canvas items once; drags only move them via coords()
+        self._track_item = self.create_line(
+            self.track_padding, self.track_y,
+            self.width - self.track_padding, self.track_y,
+            fill=COLORS["text"], width=2)
+        self._range_item = self.create_line(
+            0, self.track_y, 0, self.track_y,
+            fill=COLORS["accent"], width=4)
+        self._min_handle = self.create_oval(
+            0, 0, 0, 0,
+            fill=COLORS["accent"], outline=COLORS["text"], tags="min_handle")
+        self._max_handle = self.create_oval(
+            0, 0, 0, 0,
+            fill=COLORS["accent"], outline=COLORS["text"], tags="max_handle")
+        self._refresh()
     
     def _value_to_x(self, value):
         """Convert value to x position"""
@@ -895,34 +1393,19 @@ class RangeSlider(tk.Canvas):
         ratio = max(0, min(1, ratio))
         return self.from_ + ratio * (self.to - self.from_)
     
-    def _draw(self):
-        """Redraw the slider"""
-        self.delete("all")
-        
+    def _refresh(self):
+        """Reposition the persistent items to match the current values"""
         min_val = self.var_min.get() if self.var_min else self.from_
         max_val = self.var_max.get() if self.var_max else self.to
-        
+
         min_x = self._value_to_x(min_val)
         max_x = self._value_to_x(max_val)
-        
-        # Track background
-        self.create_line(self.track_padding, self.track_y, 
-                        self.width - self.track_padding, self.track_y,
-                        fill=COLORS["text"], width=2)
-        
-        # Selected range
-        self.create_line(min_x, self.track_y, max_x, self.track_y,
-                        fill=COLORS["accent"], width=4)
-        
-        # Min handle
-        self.create_oval(min_x - self.handle_radius, self.track_y - self.handle_radius,
-                        min_x + self.handle_radius, self.track_y + self.handle_radius,
-                        fill=COLORS["accent"], outline=COLORS["text"], tags="min_handle")
-        
-        # Max handle
-        self.create_oval(max_x - self.handle_radius, self.track_y - self.handle_radius,
-                        max_x + self.handle_radius, self.track_y + self.handle_radius,
-                        fill=COLORS["accent"], outline=COLORS["text"], tags="max_handle")
+        r = self.handle_radius
+        y = self.track_y
+
+        self.coords(self._range_item, min_x, y, max_x, y)
+        self.coords(self._min_handle, min_x - r, y - r, min_x + r, y + r)
+        self.coords(self._max_handle, max_x - r, y - r, max_x + r, y + r)
     
     def _on_click(self, event):
         """Handle click - determine which handle to drag"""
@@ -942,12 +1425,21 @@ class RangeSlider(tk.Canvas):
             self._update_value(event.x)
     
     def _on_drag(self, event):
-        """Handle drag"""
+        """Handle drag — coalesce motion events to one update per idle slot"""
         if self.dragging:
-            self._update_value(event.x)
+            if self._pending_drag_x is None:
+                self.after_idle(self._apply_pending_drag)
+            self._pending_drag_x = event.x
+
+    def _apply_pending_drag(self):
+        x, self._pending_drag_x = self._pending_drag_x, None
+        if self.dragging and x is not None:
+            self._update_value(x)
     
     def _on_release(self, event):
-        """Handle release"""
+        """Handle release — flush any drag position still waiting on idle"""
+        if self._pending_drag_x is not None:
+            self._apply_pending_drag()
         self.dragging = None
     
     def _update_value(self, x):
@@ -969,7 +1461,7 @@ class RangeSlider(tk.Canvas):
             if self.var_max:
                 self.var_max.set(value)
         
-        self._draw()
+        self._refresh()
         if self.on_change:
             self.on_change()
 
@@ -988,6 +1480,7 @@ class CollapsibleVoteBlock(ttk.Frame):
         super().__init__(master, **kwargs)
         self.block_name = block_name
         self.keys = keys
+        self._keys_set = set(keys)
         self.title = title
         self.normalize_mode = normalize_mode
         self.summary_func = summary_func
@@ -999,7 +1492,29 @@ class CollapsibleVoteBlock(ttk.Frame):
         self.perfume_id = None
         self.fr_votes = {}
         self.my_votes = {}
-        
+
+        # Memoized (sample, summary, fractions) for the current counts;
+        # repaints from toggles/resizes reuse it instead of renormalizing
+        self._calc_key = None
+        self._calc_val = None
+
+        # set_data repaints are coalesced: a burst in one event-loop
+        # iteration paints once at idle
+        self._render_pending = False
+
+        # Last-applied title/symbol/pack state, to skip no-op Tcl calls
+        self._last_symbol = None
+        self._last_title = None
+        self._content_packed = False
+
+        # Per-key row widgets, built once on first expand and then
+        # reconfigured in place: (row, label, canvas, track_item,
+        # bar_item, pct_label) per key
+        self._row_widgets = []
+        # Width at which an all-zero block was last cleared; repeat
+        # renders of empty blocks at that width short-circuit
+        self._empty_width = None
+
         # Title frame (always visible)
         self.title_frame = ttk.Frame(self, style="Panel.TFrame", cursor="hand2")
         self.title_frame.pack(fill="x", pady=2)
@@ -1020,121 +1535,169 @@ class CollapsibleVoteBlock(ttk.Frame):
         # Content frame (shown when expanded)
         self.content_frame = ttk.Frame(self, style="Panel.TFrame")
         
-        # Bind resize event to re-render bars
+        # Bind resize event to cache the width and re-render bars;
+        # _render_bars reads the cache instead of a winfo_width()
+        # round-trip per repaint
         self.bind("<Configure>", self._on_resize)
-        self._last_width = 0
-        
+        self._cached_width = 0
+
     def _on_resize(self, event):
-        """Re-render bars when width changes significantly"""
-        current_width = self.winfo_width()
-        if abs(current_width - self._last_width) > 20 and self.expanded:  # 20px threshold
-            self._last_width = current_width
-            if hasattr(self, 'perfume_id') and self.perfume_id:
-                self._render_bars()
+        """Cache width from the event; re-render on significant change"""
+        prev = self._cached_width
+        self._cached_width = event.width
+        if abs(event.width - prev) > 20 and self.expanded and self.perfume_id:  # 20px threshold
+            if not self._render_pending:
+                self._render_pending = True
+                self.after_idle(self._do_render)
     
     def set_data(self, perfume_id: str, fr_votes: Dict, my_votes: Dict, expanded: bool):
         self.perfume_id = perfume_id
         self.fr_votes = fr_votes or {}
         self.my_votes = my_votes or {}
         self.expanded = expanded
-        self._render()
-    
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._do_render)
+
+    def _do_render(self):
+        self._render_pending = False
+        if self.winfo_exists():
+            self._render()
+
+    def _calc(self):
+        """Sample size, summary and normalized fractions for the current
+        fr_votes; cached until the vote counts themselves change."""
+        key = (self.normalize_mode, tuple(self.fr_votes.get(k, 0) for k in self.keys))
+        if key != self._calc_key:
+            if self.normalize_mode == "max":
+                sample = sample_size_for_block(self.fr_votes, self.keys, "max")
+                fractions = normalize_votes_max(self.fr_votes, self.keys)
+            else:
+                sample = sample_size_for_block(self.fr_votes, self.keys, "sum")
+                fractions = normalize_votes_sum(self.fr_votes, self.keys)
+            self._calc_key = key
+            self._calc_val = (sample, self.summary_func(self.fr_votes, self.keys), fractions)
+        return self._calc_val
+
     def _render(self):
-        # Calculate sample size
-        if self.normalize_mode == "max":
-            sample = sample_size_for_block(self.fr_votes, self.keys, "max")
-            sample_type = "max"
-        else:
-            sample = sample_size_for_block(self.fr_votes, self.keys, "sum")
-            sample_type = "votes"
-        
-        # Calculate summary
-        summary = self.summary_func(self.fr_votes, self.keys)
-        
-        # Low sample warning
-        if sample > 0 and sample < LOW_SAMPLE_THRESHOLD:
-            sample_text = f"(⚠ {sample} {sample_type})"
-        elif sample > 0:
-            sample_text = f"({sample} {sample_type})"
-        else:
-            sample_text = "(No data)"
-        
-        # Update symbol and title separately to avoid text shifting
+        sample, summary, _ = self._calc()
+        sample_type = "max" if self.normalize_mode == "max" else "votes"
+
+        # Low sample warning (formatted once per distinct count)
+        sample_text = _sample_text(sample, sample_type)
+
+        # Update symbol and title separately to avoid text shifting;
+        # skip the Tcl config calls when the strings are unchanged so a
+        # collapsed block re-render is nearly free
         symbol = "－" if self.expanded else "＋"
-        self.symbol_label.config(text=symbol)
-        self.title_label.config(text=f"{self.title}: {summary}  {sample_text}")
-        
-        # Show/hide content
+        if symbol != self._last_symbol:
+            self._last_symbol = symbol
+            self.symbol_label.config(text=symbol)
+        title_text = f"{self.title}: {summary}  {sample_text}"
+        if title_text != self._last_title:
+            self._last_title = title_text
+            self.title_label.config(text=title_text)
+
+        # Show/hide content (only touch pack when the state flips)
         if self.expanded:
-            self.content_frame.pack(fill="x", padx=(20, 0), pady=(2, 8))
+            if not self._content_packed:
+                self.content_frame.pack(fill="x", padx=(20, 0), pady=(2, 8))
+                self._content_packed = True
             self._render_bars()
-        else:
+        elif self._content_packed:
             self.content_frame.pack_forget()
+            self._content_packed = False
     
     def _render_bars(self):
-        # Clear previous content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Normalize votes
-        if self.normalize_mode == "max":
-            fractions = normalize_votes_max(self.fr_votes, self.keys)
-        else:
-            fractions = normalize_votes_sum(self.fr_votes, self.keys)
-        
-        # Check which options user has voted for (can be multiple for season_time)
-        my_voted_keys = set()
-        for k in self.keys:
-            if int(self.my_votes.get(k, 0) or 0) > 0:
-                my_voted_keys.add(k)
-        
+        # Normalized fractions come from the memoized calc
+        fractions = self._calc()[2]
+
+        # Check which options user has voted for (can be multiple for
+        # season_time). my_votes holds at most a handful of entries, so
+        # iterate it rather than dict-getting every key
+        my_voted_keys = {k for k, v in self.my_votes.items() if v > 0 and k in self._keys_set}
+
         # Use global label width for alignment across all blocks
         label_width_px = self.global_label_width
-        
+
         # Calculate dynamic bar width
         # Fixed widths: label(global) + padding(4+8) + percentage(70) = variable
         # Min bar width: 50px
-        available_width = self.winfo_width()
+        available_width = self._cached_width
         if available_width <= 1:  # Not yet rendered
             available_width = 400  # Default
-        
+
         max_bar_width = max(50, available_width - label_width_px - 98)  # 98 = 4 + 8 + 70 + 16 (padding + pct + margin)
-        
+
+        # All-zero block with no personal vote: after one clearing pass
+        # at a given width the rows stay correct, so repeat renders
+        # (toggles, switching between two no-data perfumes) return
+        # immediately. The rows themselves stay visible — the option
+        # labels are the click-to-vote targets even without data.
+        empty = not any(fractions) and not my_voted_keys
+        if empty and self._empty_width == max_bar_width:
+            return
+
+        # Rows are built once (keys never change per block) and then
+        # reconfigured in place — no per-render widget destroy/create
+        if not self._row_widgets:
+            self._build_rows(label_width_px)
+
+        # Loop invariants hoisted out of the per-key iteration
+        accent = COLORS["accent"]
+        accent2 = COLORS["accent2"]
+        accent2_bg = COLORS["accent2_bg"]
+        track_default = "#3a3a3a"
+
         for i, key in enumerate(self.keys):
-            row = ttk.Frame(self.content_frame, style="Panel.TFrame")
-            row.pack(fill="x", pady=1)
-            
+            _row, label, canvas, track_item, bar_item, pct_label = self._row_widgets[i]
+
             # Determine colors - my vote only affects bar track color
             is_my_vote = (key in my_voted_keys)
-            bar_color = COLORS["accent2"] if is_my_vote else COLORS["accent"]
-            
+            bar_color = accent2 if is_my_vote else accent
+            track_color = accent2_bg if is_my_vote else track_default
+
+            canvas.config(width=max_bar_width)
+            canvas.coords(track_item, 0, 2, max_bar_width, 16)
+            canvas.itemconfigure(track_item, fill=track_color)
+
+            bar_width = int(fractions[i] * max_bar_width)
+            if bar_width > 0:
+                canvas.coords(bar_item, 0, 2, bar_width, 16)
+                canvas.itemconfigure(bar_item, fill=bar_color, state="normal")
+            else:
+                canvas.itemconfigure(bar_item, state="hidden")
+
+            # Percentage label (right-aligned, width for "100.0%" = 6 chars + margin)
+            pct_label.config(text=_pct_text(fractions[i] * 100))
+
+        self._empty_width = max_bar_width if empty else None
+
+    def _build_rows(self, label_width_px: int):
+        """Create the per-key row widgets and canvas items, one time"""
+        label_char_width = int(label_width_px / 7)  # Approximate conversion to char units
+        for key in self.keys:
+            row = ttk.Frame(self.content_frame, style="Panel.TFrame")
+            row.pack(fill="x", pady=1)
+
             # Option label (clickable) - dynamic width
-            label_text = display_label(key)
-            label_char_width = int(label_width_px / 7)  # Approximate conversion to char units
-            label = tk.Label(row, text=label_text, width=label_char_width, anchor="w", 
+            label = tk.Label(row, text=display_label(key), width=label_char_width, anchor="w",
                            bg=COLORS["panel"], fg=COLORS["text"], cursor="hand2")
             label.pack(side="left")
             label.bind("<Button-1>", lambda e, k=key: self._on_option_click(k))
-            
-            # Bar canvas
-            bar_width = int(fractions[i] * max_bar_width)
-            canvas = tk.Canvas(row, width=max_bar_width, height=18, 
+
+            # Bar canvas: background track + filled bar, repositioned per render
+            canvas = tk.Canvas(row, width=50, height=18,
                              bg=COLORS["panel"], highlightthickness=0)
             canvas.pack(side="left", padx=(4, 8))  # Reduced left padding from 8 to 4
-            
-            # Draw background track - use accent2_bg for my votes
-            track_color = COLORS["accent2_bg"] if is_my_vote else "#3a3a3a"
-            canvas.create_rectangle(0, 2, max_bar_width, 16, fill=track_color, outline="")
-            
-            # Draw filled bar on top
-            if bar_width > 0:
-                canvas.create_rectangle(0, 2, bar_width, 16, fill=bar_color, outline="")
-            
-            # Percentage label (right-aligned, width for "100.0%" = 6 chars + margin)
-            pct = fractions[i] * 100
-            pct_label = tk.Label(row, text=f"{pct:.1f}%", width=8, anchor="e",
+            track_item = canvas.create_rectangle(0, 2, 50, 16, fill="#3a3a3a", outline="")
+            bar_item = canvas.create_rectangle(0, 2, 0, 16, fill=COLORS["accent"], outline="", state="hidden")
+
+            pct_label = tk.Label(row, text="", width=8, anchor="e",
                                bg=COLORS["panel"], fg=COLORS["text"])
             pct_label.pack(side="left")
+
+            self._row_widgets.append((row, label, canvas, track_item, bar_item, pct_label))
     
     def _on_title_click(self, event):
         """Toggle expand/collapse"""
@@ -1179,81 +1742,107 @@ class MiniBar(ttk.Frame):
         self._block_name = None
         self._fr_votes = {}
         self._my_votes = {}
+        self._normalize_mode = "sum"
+        self._render_pending = False
+
+        # Persistent canvas items: one background, one bar per key, a
+        # marker dot and the sample text. Repaints reposition these with
+        # coords/itemconfigure instead of delete("all") + recreate, so a
+        # redraw costs O(n) cheap configure calls and no item churn.
+        self._bg_item = self.canvas.create_rectangle(
+            0, 0, width, height, fill=COLORS["nodata"], outline=COLORS["line"])
+        self._bar_items = [
+            self.canvas.create_rectangle(0, 0, 0, 0, fill=COLORS["accent"], outline="")
+            for _ in keys
+        ]
+        self._marker_item = self.canvas.create_oval(
+            0, 0, 0, 0, fill=COLORS["accent2"], outline="", state="hidden")
+        self._text_item = self.canvas.create_text(
+            width - 2, 1, text="", anchor="ne",
+            fill=COLORS["muted"], font=("TkDefaultFont", 7), state="hidden")
 
     def set_data(self, perfume_id: str, block_name: str, fr_votes: Dict, my_votes: Dict, normalize_mode: str):
         self._perfume_id = perfume_id
         self._block_name = block_name
         self._fr_votes = fr_votes or {}
         self._my_votes = my_votes or {}
+        self._normalize_mode = normalize_mode
+
+        # Coalesce: repeated set_data in one event-loop iteration
+        # normalizes and paints once at idle, with the latest data
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._do_render)
 
-        # Determine background state
-        if normalize_mode == "max":
+    def _do_render(self):
+        self._render_pending = False
+        if not self.winfo_exists():
+            return
+        if self._normalize_mode == "max":
             norm = normalize_votes_max(self._fr_votes, self.keys)
             sample = sample_size_for_block(self._fr_votes, self.keys, "max")
         else:
             norm = normalize_votes_sum(self._fr_votes, self.keys)
             sample = sample_size_for_block(self._fr_votes, self.keys, "sum")
-
         self._render(norm, sample)
 
     def _render(self, norm: List[float], sample_size: int):
-        self.canvas.delete("all")
+        canvas = self.canvas
+        total = sum(norm)
 
         # Background
-        if sum(norm) <= 0:
+        if total <= 0:
             bg = COLORS["nodata"]
         elif sample_size < LOW_SAMPLE_THRESHOLD:
             bg = COLORS["lowsample"]
         else:
             bg = COLORS["panel"]
-
-        self.canvas.create_rectangle(0, 0, self.width, self.height, fill=bg, outline=COLORS["line"])
+        canvas.itemconfigure(self._bg_item, fill=bg)
 
         # Bars (horizontal segmented)
         n = len(self.keys)
         if n <= 0:
             return
-        seg_w = self.width / n
+        width = self.width
 
         for i, frac in enumerate(norm):
-            x0 = int(i * seg_w)
-            x1 = int((i + 1) * seg_w)
+            # Integer segment bounds: exact, no float truncation drift
+            x0 = i * width // n
+            x1 = (i + 1) * width // n
             bar_h = int(frac * (self.height - 2))
             y0 = self.height - 1 - bar_h
             y1 = self.height - 1
-            # Base color (Fragrantica)
-            self.canvas.create_rectangle(x0 + 1, y0, x1 - 1, y1, fill=COLORS["accent"], outline="")
+            canvas.coords(self._bar_items[i], x0 + 1, y0, x1 - 1, y1)
 
-        # Personal marker (dot at chosen option)
+        # Personal marker (dot at chosen option) — one pass finds both
+        # the chosen key and its index
         my_block = self._my_votes or {}
-        chosen = None
-        for k in self.keys:
-            if int(my_block.get(k, 0) or 0) > 0:
-                chosen = k
+        idx = -1
+        for i, k in enumerate(self.keys):
+            if my_block.get(k, 0) > 0:
+                idx = i
                 break
-        if chosen:
-            idx = self.keys.index(chosen)
-            cx = int((idx + 0.5) * seg_w)
-            cy = int(self.height / 2)
+        if idx >= 0:
+            cx = (2 * idx + 1) * width // (2 * n)
+            cy = self.height // 2
             r = 3
-            self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill=COLORS["accent2"], outline="")
+            canvas.coords(self._marker_item, cx - r, cy - r, cx + r, cy + r)
+            canvas.itemconfigure(self._marker_item, state="normal")
+        else:
+            canvas.itemconfigure(self._marker_item, state="hidden")
 
         # Tooltip-ish sample text (tiny)
-        if sum(norm) > 0:
-            self.canvas.create_text(
-                self.width - 2, 1,
-                text=f"{sample_size}",
-                anchor="ne",
-                fill=COLORS["muted"],
-                font=("TkDefaultFont", 7),
-            )
+        if total > 0:
+            canvas.itemconfigure(self._text_item, text=f"{sample_size}", state="normal")
+        else:
+            canvas.itemconfigure(self._text_item, state="hidden")
 
     def _hit_test_index(self, x: int) -> Optional[int]:
         n = len(self.keys)
         if n <= 0:
             return None
-        seg_w = self.width / n
-        idx = int(x / seg_w)
+        # Integer arithmetic: one multiply + floor-div, no float round-trip
+        idx = x * n // self.width
         if idx < 0 or idx >= n:
             return None
         return idx
@@ -1289,7 +1878,10 @@ class SortDialog(tk.Toplevel):
         ("value", "Price Value"),
         ("state", "State"),
     ]
-    
+    # O(1) lookups derived from DIMENSIONS once at class creation
+    DIM_LABELS = dict(DIMENSIONS)
+    DIM_KEYS = [d for d, _ in DIMENSIONS]
+
     def __init__(self, parent, current_config: SortConfig, on_apply):
         super().__init__(parent)
         self.title("Sort Configuration")
@@ -1303,7 +1895,8 @@ class SortDialog(tk.Toplevel):
         
         # Track active dimensions
         self.active_dimensions = list(current_config.dimensions)  # [(dim, order), ...]
-        self.available_dims = [d for d, _ in self.DIMENSIONS if d not in [dim for dim, _ in self.active_dimensions]]
+        active_set = {dim for dim, _ in self.active_dimensions}
+        self.available_dims = [d for d in self.DIM_KEYS if d not in active_set]
         
         self._build_ui()
         self._refresh()
@@ -1378,9 +1971,11 @@ class SortDialog(tk.Toplevel):
             except tk.TclError:
                 pass  # Widget was destroyed
         
-        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
-        
+        # Bind once on the dialog: wheel events over any child bubble up
+        # to the toplevel bindtag, so no global bind/unbind churn on
+        # every pointer enter/leave
+        self.bind("<MouseWheel>", on_mousewheel)
+
         # Hint
         ttk.Label(main, text="Hint: Double-click left to add, double-click right to remove, use ▲▼ to adjust priority", 
                   style="Muted.TLabel").grid(row=3, column=0, columnspan=2, sticky="w", pady=(12, 0))
@@ -1404,9 +1999,9 @@ class SortDialog(tk.Toplevel):
         if self.active_dimensions:
             lines = []
             for idx, (dim, order) in enumerate(self.active_dimensions):
-                dim_label = next(lbl for d, lbl in self.DIMENSIONS if d == dim)
+                dim_label = self.DIM_LABELS[dim]
                 orders = self._get_orders_for_dimension(dim)
-                order_display = orders.get(order, list(orders.values())[0])
+                order_display = orders.get(order, next(iter(orders.values())))
                 lines.append(f"{idx+1}. {dim_label} ({order_display})")
             self.active_text_frame.insert("1.0", "\n".join(lines))
         else:
@@ -1416,10 +2011,10 @@ class SortDialog(tk.Toplevel):
     def _refresh(self):
         # Update available list
         self.available_list.delete(0, "end")
-        self.available_dims = [d for d, _ in self.DIMENSIONS if d not in [dim for dim, _ in self.active_dimensions]]
+        active_set = {dim for dim, _ in self.active_dimensions}
+        self.available_dims = [d for d in self.DIM_KEYS if d not in active_set]
         for dim in self.available_dims:
-            label = next(lbl for d, lbl in self.DIMENSIONS if d == dim)
-            self.available_list.insert("end", label)
+            self.available_list.insert("end", self.DIM_LABELS[dim])
         
         # Update active list
         for widget in self.active_frame.winfo_children():
@@ -1439,15 +2034,16 @@ class SortDialog(tk.Toplevel):
         ttk.Label(frame, text=f"{idx+1}.", style="Panel.TLabel", width=3).pack(side="left")
         
         # Dimension label
-        dim_label = next(lbl for d, lbl in self.DIMENSIONS if d == dim)
+        dim_label = self.DIM_LABELS[dim]
         ttk.Label(frame, text=dim_label, style="Panel.TLabel", width=10).pack(side="left", padx=(4, 8))
         
         # Order dropdown
         orders = self._get_orders_for_dimension(dim)
         # Convert order key to display value
-        order_display = orders.get(order, list(orders.values())[0])
+        order_display = orders.get(order, next(iter(orders.values())))
         var_order = tk.StringVar(value=order_display)
-        order_cb = ttk.Combobox(frame, textvariable=var_order, values=list(orders.values()), 
+        order_cb = ttk.Combobox(frame, textvariable=var_order,
+                               values=self._ORDER_VALUES.get(dim, self._ORDER_VALUES_DEFAULT),
                                width=12, state="readonly")
         order_cb.pack(side="left", padx=(0, 8))
         order_cb.bind("<<ComboboxSelected>>", lambda e, i=idx, v=var_order: self._on_order_change(i, v.get()))
@@ -1469,24 +2065,42 @@ class SortDialog(tk.Toplevel):
             if isinstance(child, ttk.Label):
                 child.bind("<Double-1>", lambda e: self._remove_active(idx))
     
+    # Shared order tables (treated as immutable); built once instead of
+    # a fresh dict literal per call. Labels are globally unique, so one
+    # reverse map covers the label -> key direction.
+    _ORDERS_GENDER = {
+        "female_first": "Female First",
+        "male_first": "Male First",
+        "unisex_first": "Unisex First",
+    }
+    _ORDERS_STATE = {
+        "owned_first": "Owned First",
+        "tested_first": "Smelled First",
+    }
+    _ORDERS_DEFAULT = {
+        "desc": "Descending",
+        "asc": "Ascending",
+    }
+    _ORDER_KEY_BY_LABEL = {
+        label: key
+        for orders in (_ORDERS_GENDER, _ORDERS_STATE, _ORDERS_DEFAULT)
+        for key, label in orders.items()
+    }
+    # Combobox value tuples, precomputed so refreshes don't re-list the
+    # shared dicts per active row
+    _ORDER_VALUES = {
+        "gender": tuple(_ORDERS_GENDER.values()),
+        "state": tuple(_ORDERS_STATE.values()),
+    }
+    _ORDER_VALUES_DEFAULT = tuple(_ORDERS_DEFAULT.values())
+
     def _get_orders_for_dimension(self, dim: str) -> Dict[str, str]:
         """Get available orders for a dimension"""
         if dim == "gender":
-            return {
-                "female_first": "Female First",
-                "male_first": "Male First",
-                "unisex_first": "Unisex First",
-            }
+            return self._ORDERS_GENDER
         elif dim == "state":
-            return {
-                "owned_first": "Owned First",
-                "tested_first": "Smelled First",
-            }
-        else:
-            return {
-                "desc": "Descending",
-                "asc": "Ascending",
-            }
+            return self._ORDERS_STATE
+        return self._ORDERS_DEFAULT
     
     def _on_double_click_available(self, event):
         """Add dimension to active list"""
@@ -1497,7 +2111,7 @@ class SortDialog(tk.Toplevel):
         idx = selection[0]
         dim = self.available_dims[idx]
         orders = self._get_orders_for_dimension(dim)
-        default_order = list(orders.keys())[0]
+        default_order = next(iter(orders))
         
         self.active_dimensions.append((dim, default_order))
         self._refresh()
@@ -1526,9 +2140,7 @@ class SortDialog(tk.Toplevel):
         """Update order for a dimension"""
         if 0 <= idx < len(self.active_dimensions):
             dim, _ = self.active_dimensions[idx]
-            orders = self._get_orders_for_dimension(dim)
-            # Find key for this label
-            order_key = next(k for k, v in orders.items() if v == order_label)
+            order_key = self._ORDER_KEY_BY_LABEL[order_label]
             self.active_dimensions[idx] = (dim, order_key)
     
     def _clear_all(self):
@@ -1554,7 +2166,8 @@ class EditEventsDialog(tk.Toplevel):
         super().__init__(parent)
         self.app = parent
         self.perfume = perfume
-        
+        self._txn_win: Optional[tk.Toplevel] = None  # cached buy/sell dialog
+
         brand_name = self.app.get_brand_name(perfume.brand_id)
         self.title(f"Events - {brand_name} {perfume.name}")
         self.configure(bg=COLORS["bg"])
@@ -1634,7 +2247,7 @@ class EditEventsDialog(tk.Toplevel):
         This ensures proper sorting with secondary sort by timestamp.
         """
         ts_str = self._get_timestamp_str(event)
-        if hasattr(event, 'event_date') and event.event_date:
+        if event.event_date:
             # event_date_00:00:00_timestamp
             return f"{event.event_date}T00:00:00_{ts_str}"
         else:
@@ -1647,8 +2260,8 @@ class EditEventsDialog(tk.Toplevel):
             self.tree.delete(item)
         
         # Sort events by sort key (newest first)
-        sorted_events = sorted(self.perfume.events, 
-                               key=lambda e: self._get_sort_key(e), reverse=True)
+        sorted_events = sorted(self.perfume.events,
+                               key=self._get_sort_key, reverse=True)
         
         action_labels = {
             "smell": "Smell",
@@ -1659,10 +2272,7 @@ class EditEventsDialog(tk.Toplevel):
         
         for e in sorted_events:
             # Display date: event_date if set, else empty
-            if hasattr(e, 'event_date') and e.event_date:
-                date_str = e.event_date
-            else:
-                date_str = ""
+            date_str = e.event_date or ""
             
             # Action label
             action_label = action_labels.get(e.event_type, e.event_type)
@@ -1727,12 +2337,9 @@ class EditEventsDialog(tk.Toplevel):
         def do_save():
             date_val = var_date.get().strip()
             # Validate date format if provided
-            if date_val:
-                try:
-                    datetime.strptime(date_val, "%Y-%m-%d")
-                except ValueError:
-                    messagebox.showwarning("Invalid", "Date must be in YYYY-MM-DD format.")
-                    return
+            if date_val and not _valid_date(date_val):
+                messagebox.showwarning("Invalid", "Date must be in YYYY-MM-DD format.")
+                return
             
             loc_str = var_loc.get().strip()
             # Auto-create outlet if new location entered
@@ -1755,124 +2362,169 @@ class EditEventsDialog(tk.Toplevel):
         
         loc_cb.focus_set()
     
-    def _add_transaction(self, event_type: str, edit_event: Event = None):
-        """Open dialog to add/edit buy/sell type event"""
-        type_name = "Buy" if event_type == "buy" else "Sell"
-        is_edit = edit_event is not None
-        
+    def _compute_defaults(self, edit_event: Optional[Event]) -> Dict[str, str]:
+        """Pre-stringified field defaults for the buy/sell dialog.
+
+        Uses explicit None checks so 0 ml and a price of 0 survive as real
+        values instead of being collapsed to "missing" by falsy tests.
+        """
+        if edit_event is None:
+            format_names = self.app.get_all_purchase_type_names()
+            return {
+                "date": "",
+                "format": format_names[0] if format_names else "",
+                "ml": "0",
+                "price": "",
+                "note": "",
+            }
+        return {
+            "date": edit_event.event_date or "",
+            "format": edit_event.purchase_type,
+            "ml": str(abs(edit_event.ml_delta)) if edit_event.ml_delta is not None else "0",
+            "price": "" if edit_event.price is None else str(edit_event.price),
+            "note": edit_event.note,
+        }
+
+    def _build_txn_dialog(self):
+        """Build the buy/sell dialog once; later opens just repopulate it"""
         win = tk.Toplevel(self)
-        win.title(f"{'Edit' if is_edit else 'Add'} {type_name}")
         win.configure(bg=COLORS["bg"])
         win.transient(self)
-        win.grab_set()
-        
+        win.withdraw()
+        win.protocol("WM_DELETE_WINDOW", self._close_txn_dialog)
+
         frm = ttk.Frame(win, style="TFrame")
         frm.pack(padx=15, pady=15)
-        
+
         # Date (optional)
         ttk.Label(frm, text="Date:", style="TLabel").grid(row=0, column=0, sticky="e", padx=(0, 8), pady=6)
-        var_date = tk.StringVar(value=edit_event.event_date if is_edit and hasattr(edit_event, 'event_date') else "")
-        date_entry = ttk.Entry(frm, textvariable=var_date, width=12)
+        self._txn_var_date = tk.StringVar()
+        date_entry = ttk.Entry(frm, textvariable=self._txn_var_date, width=12)
         date_entry.grid(row=0, column=1, sticky="w", pady=6)
         ttk.Label(frm, text="(YYYY-MM-DD, optional)", style="Muted.TLabel").grid(row=0, column=2, sticky="w", padx=(5, 0))
-        
+
         # Format (full/tester/decant) - readonly, can only select from list
         ttk.Label(frm, text="Format:", style="TLabel").grid(row=1, column=0, sticky="e", padx=(0, 8), pady=6)
-        format_names = self.app.get_all_purchase_type_names()
-        default_format = edit_event.purchase_type if is_edit else (format_names[0] if format_names else "")
-        var_format = tk.StringVar(value=default_format)
-        format_cb = ttk.Combobox(frm, textvariable=var_format, values=format_names, width=15, state="readonly")
-        format_cb.grid(row=1, column=1, sticky="w", pady=6)
-        
+        self._txn_var_format = tk.StringVar()
+        self._txn_format_cb = ttk.Combobox(frm, textvariable=self._txn_var_format, width=15, state="readonly")
+        self._txn_format_cb.grid(row=1, column=1, sticky="w", pady=6)
+
         # ML (positive only) - for edit, show absolute value
         ttk.Label(frm, text="ML:", style="TLabel").grid(row=2, column=0, sticky="e", padx=(0, 8), pady=6)
-        default_ml = abs(edit_event.ml_delta) if is_edit and edit_event.ml_delta else 0
-        var_ml = tk.StringVar(value=str(default_ml))
-        ml_entry = ttk.Entry(frm, textvariable=var_ml, width=10)
+        self._txn_var_ml = tk.StringVar()
+        ml_entry = ttk.Entry(frm, textvariable=self._txn_var_ml, width=10)
         ml_entry.grid(row=2, column=1, sticky="w", pady=6)
-        
+
         # Quick ML buttons
         ml_btns = ttk.Frame(frm, style="TFrame")
         ml_btns.grid(row=2, column=2, sticky="w", padx=(8, 0))
-        for txt, val in [("1", "1"), ("5", "5"), ("10", "10"), ("30", "30"), ("50", "50"), ("100", "100")]:
-            ttk.Button(ml_btns, text=txt, width=3, 
-                      command=lambda v=val: var_ml.set(v)).pack(side="left", padx=1)
-        
+        for txt in ("1", "5", "10", "30", "50", "100"):
+            ttk.Button(ml_btns, text=txt, width=3,
+                      command=partial(self._txn_var_ml.set, txt)).pack(side="left", padx=1)
+
         # Price (non-negative, blank = not entered)
         ttk.Label(frm, text="Price:", style="TLabel").grid(row=3, column=0, sticky="e", padx=(0, 8), pady=6)
-        # Show blank if None, otherwise show the number (including 0)
-        default_price_str = "" if (not is_edit or edit_event.price is None) else str(edit_event.price)
-        var_price = tk.StringVar(value=default_price_str)
-        price_entry = ttk.Entry(frm, textvariable=var_price, width=10)
+        self._txn_var_price = tk.StringVar()
+        price_entry = ttk.Entry(frm, textvariable=self._txn_var_price, width=10)
         price_entry.grid(row=3, column=1, sticky="w", pady=6)
-        
+
         # Note
         ttk.Label(frm, text="Note:", style="TLabel").grid(row=4, column=0, sticky="e", padx=(0, 8), pady=6)
-        var_note = tk.StringVar(value=edit_event.note if is_edit else "")
-        note_entry = ttk.Entry(frm, textvariable=var_note, width=28)
+        self._txn_var_note = tk.StringVar()
+        note_entry = ttk.Entry(frm, textvariable=self._txn_var_note, width=28)
         note_entry.grid(row=4, column=1, columnspan=2, sticky="w", pady=6)
-        
+
         # Buttons
         btn_frame = ttk.Frame(frm, style="TFrame")
         btn_frame.grid(row=5, column=0, columnspan=3, sticky="e", pady=(10, 0))
-        
-        def do_save():
-            # Validate ML - must be positive number
+
+        ttk.Button(btn_frame, text="Cancel", command=self._close_txn_dialog).pack(side="right")
+        self._txn_save_btn = ttk.Button(btn_frame, command=self._save_txn)
+        self._txn_save_btn.pack(side="right", padx=(0, 8))
+
+        self._txn_win = win
+
+    def _close_txn_dialog(self):
+        """Hide the cached dialog; it is reused by the next open"""
+        self._txn_win.grab_release()
+        self._txn_win.withdraw()
+
+    def _add_transaction(self, event_type: str, edit_event: Event = None):
+        """Open dialog to add/edit buy/sell type event"""
+        type_name = "Buy" if event_type == "buy" else "Sell"
+        is_edit = edit_event is not None
+        defaults = self._compute_defaults(edit_event)
+
+        if self._txn_win is None or not self._txn_win.winfo_exists():
+            self._build_txn_dialog()
+
+        self._txn_context = (event_type, edit_event)
+        win = self._txn_win
+        win.title(f"{'Edit' if is_edit else 'Add'} {type_name}")
+        self._txn_format_cb.configure(values=self.app.get_all_purchase_type_names())
+        self._txn_var_date.set(defaults["date"])
+        self._txn_var_format.set(defaults["format"])
+        self._txn_var_ml.set(defaults["ml"])
+        self._txn_var_price.set(defaults["price"])
+        self._txn_var_note.set(defaults["note"])
+        self._txn_save_btn.configure(text="Save" if is_edit else "Add")
+
+        win.deiconify()
+        win.grab_set()
+        self._txn_format_cb.focus_set()
+
+    def _save_txn(self):
+        event_type, edit_event = self._txn_context
+        is_edit = edit_event is not None
+
+        # Validate ML - must be positive number
+        try:
+            ml = float(self._txn_var_ml.get() or "0")
+            if ml < 0:
+                messagebox.showwarning("Invalid", "ML must be a positive number.")
+                return
+        except ValueError:
+            messagebox.showwarning("Invalid", "ML must be a number.")
+            return
+
+        # Validate Price - must be non-negative number (blank = None, 0 = free)
+        price_str = self._txn_var_price.get().strip()
+        if price_str == "":
+            price = None  # Blank means no price entered
+        else:
             try:
-                ml = float(var_ml.get() or "0")
-                if ml < 0:
-                    messagebox.showwarning("Invalid", "ML must be a positive number.")
+                price = float(price_str)
+                if price < 0:
+                    messagebox.showwarning("Invalid", "Price must be a non-negative number.")
                     return
             except ValueError:
-                messagebox.showwarning("Invalid", "ML must be a number.")
+                messagebox.showwarning("Invalid", "Price must be a number.")
                 return
-            
-            # Validate Price - must be non-negative number (blank = None, 0 = free)
-            price_str = var_price.get().strip()
-            if price_str == "":
-                price = None  # Blank means no price entered
-            else:
-                try:
-                    price = float(price_str)
-                    if price < 0:
-                        messagebox.showwarning("Invalid", "Price must be a non-negative number.")
-                        return
-                except ValueError:
-                    messagebox.showwarning("Invalid", "Price must be a number.")
-                    return
-            
-            date_val = var_date.get().strip()
-            # Validate date format if provided
-            if date_val:
-                try:
-                    datetime.strptime(date_val, "%Y-%m-%d")
-                except ValueError:
-                    messagebox.showwarning("Invalid", "Date must be in YYYY-MM-DD format.")
-                    return
-            
-            if is_edit:
-                # Update existing event
-                name = var_format.get().strip()
-                edit_event.purchase_type = name
-                edit_event.purchase_type_id = self.app.get_purchase_type_id_by_name(name)
-                edit_event.ml_delta = ml if event_type == "buy" else -ml if ml else None
-                edit_event.price = price  # None if blank, 0 if free, or actual price
-                edit_event.note = var_note.get().strip()
-                edit_event.event_date = date_val
-                self.app.save()
-            else:
-                self.app._add_event_transaction(
-                    self.perfume, event_type, 
-                    var_format.get(), ml, price, var_note.get(), date_val
-                )
-            self._refresh_list()
-            self.app._on_select()  # Refresh main window to update owned ml
-            win.destroy()
-        
-        ttk.Button(btn_frame, text="Cancel", command=win.destroy).pack(side="right")
-        ttk.Button(btn_frame, text="Save" if is_edit else "Add", command=do_save).pack(side="right", padx=(0, 8))
-        
-        format_cb.focus_set()
+
+        date_val = self._txn_var_date.get().strip()
+        # Validate date format if provided
+        if date_val and not _valid_date(date_val):
+            messagebox.showwarning("Invalid", "Date must be in YYYY-MM-DD format.")
+            return
+
+        if is_edit:
+            # Update existing event
+            name = self._txn_var_format.get().strip()
+            edit_event.purchase_type = name
+            edit_event.purchase_type_id = self.app.get_purchase_type_id_by_name(name)
+            edit_event.ml_delta = ml if event_type == "buy" else -ml if ml else None
+            edit_event.price = price  # None if blank, 0 if free, or actual price
+            edit_event.note = self._txn_var_note.get().strip()
+            edit_event.event_date = date_val
+            self.app.save()
+        else:
+            self.app._add_event_transaction(
+                self.perfume, event_type,
+                self._txn_var_format.get(), ml, price, self._txn_var_note.get(), date_val
+            )
+        self._refresh_list()
+        self.app._on_select()  # Refresh main window to update owned ml
+        self._close_txn_dialog()
     
     def _edit_selected(self):
         """Edit selected event"""
@@ -1937,7 +2589,13 @@ class ManageDataDialog(tk.Toplevel):
         self.current_tab = "brands"
         # Get sort mode from app_data (persistent)
         self.sort_mode = self.app.app_data.sort_modes.get("brands", "name")
-        
+
+        # One coalesced save per editing burst instead of one per click
+        self._dirty = False
+        self._save_after: Optional[str] = None
+        self._last_sig = None  # rows currently shown, to skip no-op refreshes
+        self._name_index: Dict[str, set] = {}  # existing names per tab for dup checks
+
         self._build_ui()
         self._refresh_list()
     
@@ -2030,7 +2688,7 @@ class ManageDataDialog(tk.Toplevel):
         self.sort_mode = self.sort_var.get()
         # Save sort mode for this tab (persistent)
         self.app.app_data.sort_modes[self.current_tab] = self.sort_mode
-        self.app.save()
+        self._mark_dirty()
         self._update_order_buttons()
         self._apply_sort_to_map()  # Reorder the mapping table
         self._refresh_list()
@@ -2046,28 +2704,61 @@ class ManageDataDialog(tk.Toplevel):
         if self.sort_mode == "custom":
             return  # Don't reorder on custom mode
         
-        current_map = self._get_current_map()
-        
-        # Build items list with name and count
-        items = []
-        for item_id, item in current_map.items():
-            name = self._get_item_name(item_id)
-            count = self._count_usage(item_id)
-            items.append((item_id, item, name, count))
-        
-        # Sort based on mode
+        current_map = self._get_current_map()
+
+        keys = list(current_map)
+        names = {k: self._get_item_name(k, current_map).lower() for k in keys}
         if self.sort_mode == "name":
-            items.sort(key=lambda x: x[2].lower())
-        elif self.sort_mode == "count":
-            items.sort(key=lambda x: (-x[3], x[2].lower()))
-        
+            new_order = sorted(keys, key=names.__getitem__)
+        else:  # count
+            counts = self._build_usage_counts()
+            new_order = sorted(keys, key=lambda k: (-counts.get(k, 0), names[k]))
+
+        # Already in this order: skip the dict rebuild and the save
+        if new_order == keys:
+            return
+
         # Rebuild the mapping dict in new order
+        items = [(k, current_map[k]) for k in new_order]
         current_map.clear()
-        for item_id, item, name, count in items:
-            current_map[item_id] = item
-        
-        self.app.save()
-    
+        current_map.update(items)
+
+        self._invalidate_name_caches()
+        self._mark_dirty()
+    
+    def _invalidate_name_caches(self):
+        """Drop name caches that depend on the current tab's map"""
+        self._name_index.pop(self.current_tab, None)
+        if self.current_tab == "purchase_types":
+            self.app._purchase_type_names_cache = None
+
+    def _mark_dirty(self):
+        """Record a pending change; one save covers a whole editing burst"""
+        self._dirty = True
+        if self._save_after is not None:
+            self.after_cancel(self._save_after)
+        self._save_after = self.after(1000, self._flush_dirty)
+
+    def _flush_dirty(self):
+        self._save_after = None
+        if self._dirty:
+            self._dirty = False
+            self.app.save()
+
+    def destroy(self):
+        """Flush any unsaved edits before the dialog goes away"""
+        if self._save_after is not None:
+            self.after_cancel(self._save_after)
+            self._save_after = None
+        if self._dirty:
+            self._dirty = False
+            # Synchronous flush: app.save() only schedules an after(250)
+            # callback, which never fires if the mainloop is exiting
+            if self.app._save_after_id is not None:
+                self.app.after_cancel(self.app._save_after_id)
+            self.app._flush_save()
+        super().destroy()
+
     def _get_current_map(self):
         """Get the mapping dict for current tab"""
         if self.current_tab == "brands":
@@ -2082,43 +2773,53 @@ class ManageDataDialog(tk.Toplevel):
             return self.app.app_data.purchase_types_map
         return {}
     
-    def _get_item_name(self, item_id: str) -> str:
+    def _get_item_name(self, item_id: str, current_map=None) -> str:
         """Get name for item (handles OutletInfo for outlets)"""
-        current_map = self._get_current_map()
+        if current_map is None:
+            current_map = self._get_current_map()
         item = current_map.get(item_id)
         if self.current_tab == "outlets" and isinstance(item, OutletInfo):
             return f"{item.name}" + (f" ({item.region})" if item.region else "")
         return item if item else ""
     
-    def _count_usage(self, item_id: str) -> int:
-        """Count how many perfumes/events use this item"""
-        count = 0
-        if self.current_tab == "brands":
-            count = sum(1 for p in self.app.perfumes if p.brand_id == item_id)
-        elif self.current_tab == "tags":
-            count = sum(1 for p in self.app.perfumes if item_id in p.tag_ids)
-        elif self.current_tab == "concentrations":
-            count = sum(1 for p in self.app.perfumes if p.concentration_id == item_id)
-        elif self.current_tab == "outlets":
-            count = sum(1 for p in self.app.perfumes if item_id in p.outlet_ids)
-        elif self.current_tab == "purchase_types":
-            count = sum(1 for p in self.app.perfumes for e in p.events if e.purchase_type_id == item_id)
-        return count
+    # Ids referenced by one perfume, per tab; id lists are deduped so a
+    # perfume counts once even if an id appears twice
+    _USAGE_EXTRACTORS = {
+        "brands": lambda p: (p.brand_id,),
+        "tags": lambda p: set(p.tag_ids),
+        "concentrations": lambda p: (p.concentration_id,),
+        "outlets": lambda p: set(p.outlet_ids),
+        "purchase_types": lambda p: (e.purchase_type_id for e in p.events),
+    }
+
+    def _build_usage_counts(self) -> Counter:
+        """Count usage of every item on the current tab in one pass over perfumes"""
+        extract = self._USAGE_EXTRACTORS[self.current_tab]
+        counts = Counter()
+        for p in self.app.perfumes:
+            counts.update(extract(p))
+        return counts
     
     def _refresh_list(self):
         """Refresh list display (uses mapping table order directly)"""
-        self.listbox.delete(0, "end")
         current_map = self._get_current_map()
-        
+
         # Display in mapping table order (already sorted by _apply_sort_to_map)
-        self.item_ids = []
-        for item_id in current_map.keys():
-            name = self._get_item_name(item_id)
-            count = self._count_usage(item_id)
-            display = f"{name} ({count})"
-            self.listbox.insert("end", display)
-            self.item_ids.append(item_id)
-        
+        counts = self._build_usage_counts()
+        self.item_ids = list(current_map)
+        displays = ["%s (%d)" % (self._get_item_name(k, current_map), counts.get(k, 0))
+                    for k in self.item_ids]
+
+        # Same tab showing identical rows: leave the Listbox alone
+        sig = (self.current_tab, tuple(displays))
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        self.listbox.delete(0, "end")
+        if displays:
+            self.listbox.insert("end", *displays)
+
         self.count_label.config(text=f"Total: {len(self.item_ids)} items")
     
     def _move_up(self):
@@ -2126,42 +2827,38 @@ class ManageDataDialog(tk.Toplevel):
         selection = self.listbox.curselection()
         if not selection or selection[0] == 0:
             return
-        
-        idx = selection[0]
-        current_map = self._get_current_map()
-        
-        # Rebuild dict with swapped order
-        items = list(current_map.items())
-        items[idx], items[idx-1] = items[idx-1], items[idx]
-        
-        current_map.clear()
-        for k, v in items:
-            current_map[k] = v
-        
-        self._refresh_list()
-        self.listbox.selection_set(idx-1)
-        self.app.save()
-    
+
+        self._swap_rows(selection[0], selection[0] - 1)
+
     def _move_down(self):
         """Move selected item down in custom order"""
         selection = self.listbox.curselection()
         if not selection or selection[0] >= len(self.item_ids) - 1:
             return
-        
-        idx = selection[0]
+
+        self._swap_rows(selection[0], selection[0] + 1)
+
+    def _swap_rows(self, idx: int, dest: int):
+        """Swap two adjacent rows, touching only the affected listbox lines"""
         current_map = self._get_current_map()
-        
+
         # Rebuild dict with swapped order
         items = list(current_map.items())
-        items[idx], items[idx+1] = items[idx+1], items[idx]
-        
+        items[idx], items[dest] = items[dest], items[idx]
+
         current_map.clear()
-        for k, v in items:
-            current_map[k] = v
-        
-        self._refresh_list()
-        self.listbox.selection_set(idx+1)
-        self.app.save()
+        current_map.update(items)
+
+        # Patch just the two moved lines instead of refreshing the whole list
+        self.item_ids[idx], self.item_ids[dest] = self.item_ids[dest], self.item_ids[idx]
+        lo = min(idx, dest)
+        first, second = self.listbox.get(lo), self.listbox.get(lo + 1)
+        self.listbox.delete(lo, lo + 1)
+        self.listbox.insert(lo, second, first)
+        self.listbox.selection_set(dest)
+        self._last_sig = None  # listbox was patched directly
+        self._invalidate_name_caches()
+        self._mark_dirty()
     
     def _rename_selected(self):
         selection = self.listbox.curselection()
@@ -2202,8 +2899,9 @@ class ManageDataDialog(tk.Toplevel):
             current_map[item_id] = new_name
             old_display = old_name
             new_display = new_name
-        
-        self.app.save()
+
+        self._invalidate_name_caches()
+        self._mark_dirty()
         self._refresh_list()
         self.app._refresh_list()
         
@@ -2217,7 +2915,7 @@ class ManageDataDialog(tk.Toplevel):
         
         selected_ids = [self.item_ids[i] for i in selection]
         current_map = self._get_current_map()
-        selected_names = [self._get_item_name(sid) for sid in selected_ids]
+        selected_names = [self._get_item_name(sid, current_map) for sid in selected_ids]
         
         # Ask which name to keep
         keep_name = simpledialog.askstring("Merge", 
@@ -2235,43 +2933,46 @@ class ManageDataDialog(tk.Toplevel):
         else:
             current_map[target_id] = keep_name
         
-        # Update all perfumes to use target_id
-        for sid in selected_ids:
-            if sid == target_id:
-                continue
-            
-            if self.current_tab == "brands":
-                for p in self.app.perfumes:
-                    if p.brand_id == sid:
-                        p.brand_id = target_id
-            elif self.current_tab == "tags":
-                for p in self.app.perfumes:
-                    if sid in p.tag_ids:
-                        p.tag_ids = [target_id if tid == sid else tid for tid in p.tag_ids]
-                        p.tag_ids = list(dict.fromkeys(p.tag_ids))
-            elif self.current_tab == "concentrations":
-                for p in self.app.perfumes:
-                    if p.concentration_id == sid:
-                        p.concentration_id = target_id
-            elif self.current_tab == "outlets":
-                for p in self.app.perfumes:
-                    if sid in p.outlet_ids:
-                        p.outlet_ids = [target_id if oid == sid else oid for oid in p.outlet_ids]
-                        p.outlet_ids = list(dict.fromkeys(p.outlet_ids))
-            elif self.current_tab == "purchase_types":
-                target_name = current_map.get(target_id, "")
-                for p in self.app.perfumes:
-                    for e in p.events:
-                        if e.purchase_type_id == sid:
-                            e.purchase_type_id = target_id
-                            e.purchase_type = target_name
-            
+        # Update all perfumes to use target_id: one pass over the library,
+        # rewriting each affected perfume exactly once against the whole
+        # set of merged ids.
+        merge_set = set(selected_ids)
+        merge_set.discard(target_id)
+
+        if self.current_tab == "brands":
+            for p in self.app.perfumes:
+                if p.brand_id in merge_set:
+                    p.brand_id = target_id
+        elif self.current_tab == "tags":
+            for p in self.app.perfumes:
+                if not merge_set.isdisjoint(p.tag_ids):
+                    p.tag_ids = [target_id if tid in merge_set else tid for tid in p.tag_ids]
+                    p.tag_ids = list(dict.fromkeys(p.tag_ids))
+        elif self.current_tab == "concentrations":
+            for p in self.app.perfumes:
+                if p.concentration_id in merge_set:
+                    p.concentration_id = target_id
+        elif self.current_tab == "outlets":
+            for p in self.app.perfumes:
+                if not merge_set.isdisjoint(p.outlet_ids):
+                    p.outlet_ids = [target_id if oid in merge_set else oid for oid in p.outlet_ids]
+                    p.outlet_ids = list(dict.fromkeys(p.outlet_ids))
+        elif self.current_tab == "purchase_types":
+            target_name = current_map.get(target_id, "")
+            for p in self.app.perfumes:
+                for e in p.events:
+                    if e.purchase_type_id in merge_set:
+                        e.purchase_type_id = target_id
+                        e.purchase_type = target_name
+
+        for sid in merge_set:
             del current_map[sid]
-        
-        self.app.save()
+
+        self._invalidate_name_caches()
+        self._mark_dirty()
         self._refresh_list()
         self.app._refresh_list()
-        
+
         messagebox.showinfo("Merged", f"Merged {len(selected_ids)} items into '{keep_name}'.")
     
     def _delete_selected(self):
@@ -2283,11 +2984,12 @@ class ManageDataDialog(tk.Toplevel):
         selected_ids = [self.item_ids[i] for i in selection]
         current_map = self._get_current_map()
         
+        counts = self._build_usage_counts()
         used_items = []
         unused_items = []
         for sid in selected_ids:
-            usage = self._count_usage(sid)
-            name = self._get_item_name(sid)
+            usage = counts.get(sid, 0)
+            name = self._get_item_name(sid, current_map)
             if usage > 0:
                 used_items.append(f"{name} ({usage})")
             else:
@@ -2306,10 +3008,11 @@ class ManageDataDialog(tk.Toplevel):
             return
         
         for sid in selected_ids:
-            if self._count_usage(sid) == 0:
+            if counts.get(sid, 0) == 0:
                 del current_map[sid]
-        
-        self.app.save()
+
+        self._invalidate_name_caches()
+        self._mark_dirty()
         self._refresh_list()
         self.app._refresh_list()  # Refresh main list but dialog stays open
     
@@ -2331,14 +3034,23 @@ class ManageDataDialog(tk.Toplevel):
             name = name.strip()
             
             current_map = self._get_current_map()
-            if name in current_map.values():
+            idx = self._name_index.get(self.current_tab)
+            if idx is None:
+                idx = {v for v in current_map.values() if isinstance(v, str)}
+                self._name_index[self.current_tab] = idx
+            if name in idx:
                 messagebox.showwarning("Exists", f"'{name}' already exists.")
                 return
-            
+
             item_id = new_id()
             current_map[item_id] = name
-        
-        self.app.save()
+            idx.add(name)
+
+        # Name index is maintained incrementally above; only the App-side
+        # purchase type list needs dropping on add
+        if self.current_tab == "purchase_types":
+            self.app._purchase_type_names_cache = None
+        self._mark_dirty()
         self._refresh_list()
 
 
@@ -2362,9 +3074,15 @@ class FilterDialog(tk.Toplevel):
         self.brands_selected = list(current_config.brands)  # Pool mode
         self.concentrations_selected = list(current_config.concentrations)
         self.locations_selected = list(current_config.locations)
-        self.vars_states = {}
-        self.vars_seasons = {}
-        self.vars_times = {}
+        # Checkbox vars are created here (not in the section builders) so
+        # _build_config works even for sections that are still collapsed
+        # and have not been built yet
+        self.vars_states = {s: tk.BooleanVar(value=s in current_config.states)
+                            for s in ("owned", "tested", "wishlist")}
+        self.vars_seasons = {s: tk.BooleanVar(value=s in current_config.seasons)
+                             for s in ("spring", "summer", "fall", "winter")}
+        self.vars_times = {t: tk.BooleanVar(value=t in current_config.times)
+                           for t in ("day", "night")}
         # Score ranges
         self.var_rating_min = tk.DoubleVar(value=current_config.rating_min)
         self.var_rating_max = tk.DoubleVar(value=current_config.rating_max)
@@ -2378,14 +3096,55 @@ class FilterDialog(tk.Toplevel):
         self.var_value_min = tk.DoubleVar(value=current_config.value_min)
         self.var_value_max = tk.DoubleVar(value=current_config.value_max)
         self.var_value_exclude = tk.BooleanVar(value=current_config.value_exclude)
-        self.vars_genders = {}  # Changed to dict of BooleanVars for multi-select
+        self.vars_genders = {g: tk.BooleanVar(value=g in current_config.gender_preference)
+                             for g in ("male", "more_male", "unisex", "more_female", "female")}
         self.var_tags_logic = tk.StringVar(value=current_config.tags_logic)
         self.var_has_my_vote = tk.BooleanVar(value=current_config.has_my_vote)
         self.var_has_fragrantica = tk.BooleanVar(value=current_config.has_fragrantica)
         self.tags_selected = list(current_config.tags)
-        
+        self._pending_count: Optional[str] = None
+        self._suppress_recount = False  # batch guards set this during bulk var resets
+        self._active_text_cache: Optional[str] = None  # text currently in the widget
+        # Score arrays for vectorized range pre-culling, as in refresh_tree
+        self._soa = PerfumeSoA(self.perfumes) if np is not None else None
+        # derive_state walks every event; its inputs are fixed while the
+        # dialog is open, so cache (state, owned_ml) per perfume id
+        self._state_cache: Dict[str, Tuple[str, float]] = {}
+        # Per-perfume eligibility bitmasks for seasons/times and genders,
+        # filled lazily; one AND replaces the per-option vote-dict lookups
+        self._when_mask_cache: Dict[str, int] = {}
+        self._gender_mask_cache: Dict[str, int] = {}
+        # Vectorized copies of the eligibility masks (built on first use)
+        self._when_arr = None
+        self._gender_arr = None
+        # Per-dimension result masks: {name: (config slice, mask)}; a
+        # recount reuses every mask whose config slice is unchanged
+        self._dim_masks: Dict[str, tuple] = {}
+        # (has any personal vote, has any Fragrantica data) per perfume;
+        # the any(dict.values()) scans are not worth repeating per recount
+        self._vote_flags_cache: Dict[str, Tuple[bool, bool]] = {}
+        # Rendered "Currently Active" text per config snapshot
+        self._text_cache: Dict[tuple, str] = {}
+        # Slider label redraws are coalesced to one flush per frame
+        self._label_after: Optional[str] = None
+        self.score_labels: Dict[str, tuple] = {}
+        self._range_sliders: List[RangeSlider] = []
+        # Bind the id->name maps once; the compiled filter predicate runs
+        # per perfume per recount and should not chase app attribute chains
+        self._brand_name_by_id = app.app_data.brands_map if app else {}
+        self._tag_name_by_id = app.app_data.tags_map if app else {}
+        # Tag names as int bitsets: one bit per distinct name, assigned on
+        # first sight; subset/overlap tests become single bignum ANDs
+        self._tag_bit_of: Dict[str, int] = {}
+        self._tag_bits: Dict[str, int] = {}
+        # Vocabulary snapshot; the owning App compares this on reopen to
+        # decide whether the cached widget tree is still valid
+        self._vocab_sig = app._filter_vocab_sig() if app else ()
+
         self._build_ui()
         self._update_result_count()
+        # Hide instead of destroy so the next open skips the rebuild
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
     
     def _build_ui(self):
         # Main scrollable canvas
@@ -2485,9 +3244,9 @@ class FilterDialog(tk.Toplevel):
         btns = ttk.Frame(content, style="TFrame")
         btns.pack(anchor="e", pady=(16, 0), padx=(0, 20))
         
-        ttk.Button(btns, text="Cancel", command=self.destroy).pack(side="left", padx=(0, 8))
+        ttk.Button(btns, text="Cancel", command=self.withdraw).pack(side="left", padx=(0, 8))
         ttk.Button(btns, text="Apply", command=self._apply).pack(side="left")
-    
+
     def _create_collapsible_section(self, parent, title, section_key, content_func):
         """Create a collapsible section with persistent expand/collapse state"""
         frame = ttk.Frame(parent, style="Panel.TFrame")
@@ -2508,30 +3267,45 @@ class FilterDialog(tk.Toplevel):
         title_label.pack(side="left", padx=(4, 0))
         
         content_frame = ttk.Frame(frame, style="Panel.TFrame")
-        
+
+        # Collapsed sections defer their widget creation until first expand
+        built = initial_expanded
+
         def toggle():
+            nonlocal built
             expanded = var_expanded.get()
             var_expanded.set(not expanded)
             symbol_label.config(text="－" if not expanded else "＋")
             # Update persistent state
             self.expanded_state[section_key] = not expanded
             if not expanded:
+                if not built:
+                    content_func(content_frame)
+                    built = True
                 content_frame.pack(fill="x", padx=16, pady=(0, 8))
             else:
                 content_frame.pack_forget()
-        
+
         title_frame.bind("<Button-1>", lambda e: toggle())
         symbol_label.bind("<Button-1>", lambda e: toggle())
         title_label.bind("<Button-1>", lambda e: toggle())
-        
-        # Create content
-        content_func(content_frame)
-        
-        # Show content if initially expanded
+
+        # Create and show content only if initially expanded
         if initial_expanded:
+            content_func(content_frame)
             content_frame.pack(fill="x", padx=16, pady=(0, 8))
     
     def _get_active_filters_text(self) -> str:
+        """Text description of active filters, memoized per config"""
+        key = self.current_config.cache_key()
+        cached = self._text_cache.get(key)
+        if cached is None:
+            if len(self._text_cache) >= 32:
+                self._text_cache.clear()
+            cached = self._text_cache[key] = self._build_active_filters_text()
+        return cached
+
+    def _build_active_filters_text(self) -> str:
         """Generate text description of currently active filters"""
         lines = []
         
@@ -2623,7 +3397,7 @@ class FilterDialog(tk.Toplevel):
             if sel and self.brands_selected:
                 self.brands_selected.pop(sel[0])
                 self._refresh_brands_listbox()
-                self._update_result_count()
+                self._schedule_result_count()
         
         self.brands_listbox.bind("<Double-1>", remove_brand)
         
@@ -2633,9 +3407,10 @@ class FilterDialog(tk.Toplevel):
         
         var_new_brand = tk.StringVar()
         brand_cb = ttk.Combobox(add_frame, textvariable=var_new_brand, width=25)
-        brand_cb["values"] = all_brands
         if self.app:
             make_combobox_searchable(brand_cb, all_brands)
+        else:
+            brand_cb["values"] = all_brands
         brand_cb.pack(side="left", padx=(0, 8))
         
         def add_brand():
@@ -2645,19 +3420,21 @@ class FilterDialog(tk.Toplevel):
                 self.brands_selected.append(brand)
                 self._refresh_brands_listbox()
                 var_new_brand.set("")
-                self._update_result_count()
+                self._schedule_result_count()
         
         ttk.Button(add_frame, text="Add", command=add_brand).pack(side="left")
         brand_cb.bind("<Return>", lambda e: add_brand())
     
     def _refresh_brands_listbox(self):
         """Refresh brands listbox"""
+        if not hasattr(self, 'brands_listbox'):
+            return  # Section not built yet (still collapsed)
         self.brands_listbox.delete(0, "end")
         if not self.brands_selected:
             self.brands_listbox.insert("end", "(All brands - double-click to remove)")
         else:
-            for brand in self.brands_selected:
-                self.brands_listbox.insert("end", brand)
+            # Single insert call: one Tcl round-trip instead of one per row
+            self.brands_listbox.insert("end", *self.brands_selected)
     
     def _create_concentrations_section(self, parent):
         """Create concentrations pool with Listbox (double-click to remove)"""
@@ -2684,7 +3461,7 @@ class FilterDialog(tk.Toplevel):
             if sel and self.concentrations_selected:
                 self.concentrations_selected.pop(sel[0])
                 self._refresh_concs_listbox()
-                self._update_result_count()
+                self._schedule_result_count()
         
         self.concs_listbox.bind("<Double-1>", remove_conc)
         
@@ -2703,19 +3480,20 @@ class FilterDialog(tk.Toplevel):
                 self.concentrations_selected.append(conc)
                 self._refresh_concs_listbox()
                 var_new_conc.set("")
-                self._update_result_count()
+                self._schedule_result_count()
         
         ttk.Button(add_frame, text="Add", command=add_conc).pack(side="left")
         conc_cb.bind("<Return>", lambda e: add_conc())
     
     def _refresh_concs_listbox(self):
         """Refresh concentrations listbox"""
+        if not hasattr(self, 'concs_listbox'):
+            return  # Section not built yet (still collapsed)
         self.concs_listbox.delete(0, "end")
         if not self.concentrations_selected:
             self.concs_listbox.insert("end", "(All concentrations - double-click to remove)")
         else:
-            for conc in self.concentrations_selected:
-                self.concs_listbox.insert("end", conc)
+            self.concs_listbox.insert("end", *self.concentrations_selected)
     
     def _create_locations_section(self, parent):
         """Create locations pool with Listbox (double-click to remove)"""
@@ -2742,7 +3520,7 @@ class FilterDialog(tk.Toplevel):
             if sel and self.locations_selected:
                 self.locations_selected.pop(sel[0])
                 self._refresh_locs_listbox()
-                self._update_result_count()
+                self._schedule_result_count()
         
         self.locs_listbox.bind("<Double-1>", remove_loc)
         
@@ -2752,9 +3530,10 @@ class FilterDialog(tk.Toplevel):
         
         var_new_loc = tk.StringVar()
         loc_cb = ttk.Combobox(add_frame, textvariable=var_new_loc, width=25)
-        loc_cb["values"] = all_locs
         if self.app:
             make_combobox_searchable(loc_cb, all_locs)
+        else:
+            loc_cb["values"] = all_locs
         loc_cb.pack(side="left", padx=(0, 8))
         
         def add_loc():
@@ -2763,19 +3542,20 @@ class FilterDialog(tk.Toplevel):
                 self.locations_selected.append(loc)
                 self._refresh_locs_listbox()
                 var_new_loc.set("")
-                self._update_result_count()
+                self._schedule_result_count()
         
         ttk.Button(add_frame, text="Add", command=add_loc).pack(side="left")
         loc_cb.bind("<Return>", lambda e: add_loc())
     
     def _refresh_locs_listbox(self):
         """Refresh locations listbox"""
+        if not hasattr(self, 'locs_listbox'):
+            return  # Section not built yet (still collapsed)
         self.locs_listbox.delete(0, "end")
         if not self.locations_selected:
             self.locs_listbox.insert("end", "(All locations - double-click to remove)")
         else:
-            for loc in self.locations_selected:
-                self.locs_listbox.insert("end", loc)
+            self.locs_listbox.insert("end", *self.locations_selected)
     
     def _create_states_section(self, parent):
         """Create states checkboxes with flow layout"""
@@ -2793,13 +3573,11 @@ class FilterDialog(tk.Toplevel):
         
         widgets_data = []
         for state_key, state_label in states:
-            var = tk.BooleanVar(value=state_key in self.current_config.states)
-            self.vars_states[state_key] = var
             widgets_data.append({
                 'type': 'checkbutton',
                 'text': state_label,
-                'variable': var,
-                'command': self._update_result_count
+                'variable': self.vars_states[state_key],
+                'command': self._schedule_result_count
             })
         
         self._create_single_row_layout(flow_container, widgets_data)  # States: single row
@@ -2814,13 +3592,11 @@ class FilterDialog(tk.Toplevel):
         
         season_widgets_data = []
         for season in seasons:
-            var = tk.BooleanVar(value=season in self.current_config.seasons)
-            self.vars_seasons[season] = var
             season_widgets_data.append({
                 'type': 'checkbutton',
                 'text': display_label(season),
-                'variable': var,
-                'command': self._update_result_count
+                'variable': self.vars_seasons[season],
+                'command': self._schedule_result_count
             })
         
         self._create_single_row_layout(season_frame, season_widgets_data)
@@ -2833,13 +3609,11 @@ class FilterDialog(tk.Toplevel):
         
         time_widgets_data = []
         for time in times:
-            var = tk.BooleanVar(value=time in self.current_config.times)
-            self.vars_times[time] = var
             time_widgets_data.append({
                 'type': 'checkbutton',
                 'text': display_label(time),
-                'variable': var,
-                'command': self._update_result_count
+                'variable': self.vars_times[time],
+                'command': self._schedule_result_count
             })
         
         self._create_single_row_layout(time_frame, time_widgets_data)
@@ -2861,9 +3635,9 @@ class FilterDialog(tk.Toplevel):
             ("Price Value", self.var_value_min, self.var_value_max, self.var_value_exclude, 0, 5),
         ]
         
-        # Store label references for updates
+        # Store label references for batched updates
         self.score_labels = {}
-        
+
         for label, var_min, var_max, var_exclude, range_min, range_max in scores:
             frame = ttk.Frame(parent, style="Panel.TFrame")
             frame.pack(fill="x", pady=4)
@@ -2874,7 +3648,7 @@ class FilterDialog(tk.Toplevel):
             
             ttk.Label(row1, text=f"{label}:", style="Panel.TLabel", width=12).pack(side="left")
             ttk.Checkbutton(row1, text="Exclude", variable=var_exclude,
-                           command=self._update_result_count).pack(side="left", padx=(0, 8))
+                           command=self._schedule_result_count).pack(side="left", padx=(0, 8))
             
             # Value labels
             min_label = ttk.Label(row1, text=f"{var_min.get():.1f}", style="Panel.TLabel", width=4)
@@ -2883,21 +3657,30 @@ class FilterDialog(tk.Toplevel):
             max_label = ttk.Label(row1, text=f"{var_max.get():.1f}", style="Panel.TLabel", width=4)
             max_label.pack(side="left")
             
-            self.score_labels[label] = (min_label, max_label)
-            
+            self.score_labels[label] = (min_label, max_label, var_min, var_max)
+
             # Row 2: Range slider
-            def make_update_callback(lbl, min_lbl, max_lbl, v_min, v_max):
-                def callback():
-                    min_lbl.config(text=f"{v_min.get():.1f}")
-                    max_lbl.config(text=f"{v_max.get():.1f}")
-                    self._update_result_count()
-                return callback
-            
-            slider = RangeSlider(frame, from_=range_min, to=range_max, 
+            slider = RangeSlider(frame, from_=range_min, to=range_max,
                                var_min=var_min, var_max=var_max,
                                width=250, height=24, bg=COLORS["panel"],
-                               on_change=make_update_callback(label, min_label, max_label, var_min, var_max))
+                               on_change=self._on_score_slider_change)
             slider.pack(fill="x", padx=(0, 10), pady=(2, 0))
+            self._range_sliders.append(slider)
+
+    def _on_score_slider_change(self):
+        """Slider motion: batch label redraws, debounce the recount"""
+        if self._label_after is None:
+            self._label_after = self.after(16, self._flush_score_labels)
+        self._schedule_result_count()
+
+    def _flush_score_labels(self):
+        """Write the current slider values into the value labels, once"""
+        self._label_after = None
+        if not self.winfo_exists():
+            return
+        for min_label, max_label, var_min, var_max in self.score_labels.values():
+            min_label.config(text=f"{var_min.get():.1f}")
+            max_label.config(text=f"{var_max.get():.1f}")
     
     def _create_gender_section(self, parent):
         """Create gender checkboxes with flow layout (multi-select)"""
@@ -2924,13 +3707,11 @@ class FilterDialog(tk.Toplevel):
         
         widgets_data = []
         for val, label in genders:
-            var = tk.BooleanVar(value=val in self.current_config.gender_preference)
-            self.vars_genders[val] = var
             widgets_data.append({
                 'type': 'checkbutton',
                 'text': label,
-                'variable': var,
-                'command': self._update_result_count
+                'variable': self.vars_genders[val],
+                'command': self._schedule_result_count
             })
         
         self._create_single_row_layout(flow_container, widgets_data)  # Gender: single row
@@ -2960,7 +3741,7 @@ class FilterDialog(tk.Toplevel):
             if sel and self.tags_selected:
                 self.tags_selected.pop(sel[0])
                 self._refresh_tags_listbox()
-                self._update_result_count()
+                self._schedule_result_count()
         
         self.tags_listbox.bind("<Double-1>", remove_tag)
         
@@ -2970,9 +3751,10 @@ class FilterDialog(tk.Toplevel):
         
         var_new_tag = tk.StringVar()
         tag_cb = ttk.Combobox(add_frame, textvariable=var_new_tag, width=25)
-        tag_cb["values"] = all_tags
         if self.app:
             make_combobox_searchable(tag_cb, all_tags)
+        else:
+            tag_cb["values"] = all_tags
         tag_cb.pack(side="left", padx=(0, 8))
         
         def add_tag():
@@ -2982,7 +3764,7 @@ class FilterDialog(tk.Toplevel):
                 self.tags_selected.append(tag)
                 self._refresh_tags_listbox()
                 var_new_tag.set("")
-                self._update_result_count()
+                self._schedule_result_count()
         
         ttk.Button(add_frame, text="Add", command=add_tag).pack(side="left")
         tag_cb.bind("<Return>", lambda e: add_tag())
@@ -2993,18 +3775,19 @@ class FilterDialog(tk.Toplevel):
         
         ttk.Label(logic_container, text="Logic:", style="Panel.TLabel").pack(side="left", padx=(0, 8))
         ttk.Radiobutton(logic_container, text="Match Any (OR)", variable=self.var_tags_logic, value="or", 
-                      command=self._update_result_count).pack(side="left", padx=(0, 12))
+                      command=self._schedule_result_count).pack(side="left", padx=(0, 12))
         ttk.Radiobutton(logic_container, text="Match All (AND)", variable=self.var_tags_logic, value="and", 
-                      command=self._update_result_count).pack(side="left")
+                      command=self._schedule_result_count).pack(side="left")
     
     def _refresh_tags_listbox(self):
         """Refresh tags listbox"""
+        if not hasattr(self, 'tags_listbox'):
+            return  # Section not built yet (still collapsed)
         self.tags_listbox.delete(0, "end")
         if not self.tags_selected:
             self.tags_listbox.insert("end", "(All tags - double-click to remove)")
         else:
-            for tag in self.tags_selected:
-                self.tags_listbox.insert("end", tag)
+            self.tags_listbox.insert("end", *self.tags_selected)
     
     def _create_vote_status_section(self, parent):
         """Create vote status checkboxes in a single row"""
@@ -3016,13 +3799,13 @@ class FilterDialog(tk.Toplevel):
                 'type': 'checkbutton',
                 'text': "Perfumes I've voted on",
                 'variable': self.var_has_my_vote,
-                'command': self._update_result_count
+                'command': self._schedule_result_count
             },
             {
                 'type': 'checkbutton',
                 'text': "Perfumes with Fragrantica data",
                 'variable': self.var_has_fragrantica,
-                'command': self._update_result_count
+                'command': self._schedule_result_count
             }
         ]
         
@@ -3065,15 +3848,34 @@ class FilterDialog(tk.Toplevel):
     
     def _toggle_all(self, vars_dict, state):
         """Toggle all checkboxes in a dict (True/False/None for flip)"""
-        for var in vars_dict.values():
-            if state is None:
-                var.set(not var.get())
-            else:
-                var.set(state)
-        self._update_result_count()
-    
+        self._suppress_recount = True
+        try:
+            for var in vars_dict.values():
+                if state is None:
+                    var.set(not var.get())
+                else:
+                    var.set(state)
+        finally:
+            self._suppress_recount = False
+        self._schedule_result_count()
+    
+    def _schedule_result_count(self):
+        """Coalesce bursts of widget callbacks into one recount per idle window"""
+        if self._suppress_recount:
+            return
+        if self._pending_count is not None:
+            self.after_cancel(self._pending_count)
+        self._pending_count = self.after(150, self._run_scheduled_count)
+
+    def _run_scheduled_count(self):
+        self._pending_count = None
+        if self.winfo_exists():
+            self._update_result_count()
+
     def _update_result_count(self):
         """Update result count label"""
+        if self._suppress_recount:
+            return
         config = self._build_config()
         count = self._count_matches(config)
         self.result_label.config(text=f"Result: {count} / {len(self.perfumes)} perfumes match")
@@ -3109,180 +3911,291 @@ class FilterDialog(tk.Toplevel):
             has_fragrantica=self.var_has_fragrantica.get(),
         )
     
+    def _when_mask_array(self):
+        """uint8 array of per-perfume season/time eligibility bitmasks"""
+        if self._when_arr is None:
+            self._when_arr = np.fromiter(
+                (_when_eligibility_mask(p) for p in self.perfumes),
+                dtype=np.uint8, count=len(self.perfumes))
+        return self._when_arr
+
+    def _gender_mask_array(self):
+        """uint8 array of per-perfume gender eligibility bitmasks"""
+        if self._gender_arr is None:
+            self._gender_arr = np.fromiter(
+                (_gender_eligibility_mask(p) for p in self.perfumes),
+                dtype=np.uint8, count=len(self.perfumes))
+        return self._gender_arr
+
     def _count_matches(self, config: FilterConfig) -> int:
-        """Count how many perfumes match the filter"""
+        """
+        Count how many perfumes match the filter. Each filter dimension
+        owns a cached boolean mask keyed by its slice of the config, so
+        toggling one control recomputes only that dimension's mask; the
+        cached masks are then ANDed together.
+        """
+        n = len(self.perfumes)
+        masks = []
+        for name, key, build in self._dimension_specs(config):
+            cached = self._dim_masks.get(name)
+            if cached is not None and cached[0] == key:
+                masks.append(cached[1])
+            else:
+                mask = build(config)
+                self._dim_masks[name] = (key, mask)
+                masks.append(mask)
+        if not masks:
+            return n
+        if np is not None:
+            final = masks[0]
+            for m in masks[1:]:
+                final = final & m
+            return int(np.count_nonzero(final))
+        # Most selective mask first so the inner loop rejects early
+        masks.sort(key=sum)
         count = 0
-        for p in self.perfumes:
-            if self._matches_filter(p, config):
+        for i in range(n):
+            for m in masks:
+                if not m[i]:
+                    break
+            else:
                 count += 1
         return count
-    
-    def _matches_filter(self, p: Perfume, config: FilterConfig) -> bool:
-        """Check if perfume matches filter"""
-        # Brands (V2: use app's brand lookup)
+
+    def _dimension_specs(self, config: FilterConfig):
+        """(name, cache key, mask builder) for each active filter dimension"""
+        specs = []
         if config.brands:
-            brand_name = self.app.get_brand_name(p.brand_id) if self.app else ""
-            if brand_name not in config.brands:
-                return False
-        
-        # States
+            specs.append(("brands", tuple(config.brands), self._mask_brands))
         if config.states:
-            tag_names = [self.app.get_tag_name(tid) for tid in p.tag_ids] if self.app else []
-            state, owned_ml = derive_state(p, tag_names, self.app.app_data.owned_ml_include_formats)
-            matches_state = False
-            if "owned" in config.states and owned_ml > 0:
-                matches_state = True
-            if "tested" in config.states and "Smelled" in state:
-                matches_state = True
-            if "wishlist" in config.states and state == "Wishlist":
-                matches_state = True
-            if not matches_state:
-                return False
-        
-        # Seasons/Times
+            specs.append(("states", tuple(config.states), self._mask_states))
         if config.seasons or config.times:
-            fr_votes = (p.fragrantica or {}).get("season_time_votes", {})
-            my_votes = (p.my_votes or {}).get("my_season_time_votes", {})
-            
-            check_items = config.seasons + config.times
-            matches_when = False
-            for item in check_items:
-                fr_val = int(fr_votes.get(item, 0) or 0)
-                my_val = int(my_votes.get(item, 0) or 0)
-                if fr_val >= 10 or my_val > 0:
-                    matches_when = True
-                    break
-            if not matches_when:
-                return False
-        
-        # Rating (range with include/exclude)
-        if config.rating_min > 0 or config.rating_max < 5.0 or config.rating_exclude:
-            fr = (p.fragrantica or {}).get("rating_votes", {})
-            score = calculate_rating_score(fr, RATING_5)
-            in_range = config.rating_min <= score <= config.rating_max
-            if config.rating_exclude:
-                if in_range:
-                    return False
-            else:
-                if not in_range:
-                    return False
-        
-        # Longevity (range with include/exclude)
-        if config.longevity_min > 0 or config.longevity_max < 5.0 or config.longevity_exclude:
-            fr = (p.fragrantica or {}).get("longevity_votes", {})
-            score = calculate_longevity_score(fr, LONGEVITY_5)
-            in_range = config.longevity_min <= score <= config.longevity_max
-            if config.longevity_exclude:
-                if in_range:
-                    return False
-            else:
-                if not in_range:
-                    return False
-        
-        # Sillage (range with include/exclude)
-        if config.sillage_min > 0 or config.sillage_max < 4.0 or config.sillage_exclude:
-            fr = (p.fragrantica or {}).get("sillage_votes", {})
-            score = calculate_sillage_score(fr, SILLAGE_4)
-            in_range = config.sillage_min <= score <= config.sillage_max
-            if config.sillage_exclude:
-                if in_range:
-                    return False
-            else:
-                if not in_range:
-                    return False
-        
-        # Value (range with include/exclude)
-        if config.value_min > 0 or config.value_max < 5.0 or config.value_exclude:
-            fr = (p.fragrantica or {}).get("value_votes", {})
-            score = calculate_value_score(fr, VALUE_5)
-            in_range = config.value_min <= score <= config.value_max
-            if config.value_exclude:
-                if in_range:
-                    return False
-            else:
-                if not in_range:
-                    return False
-        
-        # Gender (multi-select)
+            specs.append(("when", (tuple(config.seasons), tuple(config.times)),
+                          self._mask_when))
+        if (config.rating_min > 0 or config.rating_max < 5.0 or config.rating_exclude
+                or config.longevity_min > 0 or config.longevity_max < 5.0 or config.longevity_exclude
+                or config.sillage_min > 0 or config.sillage_max < 4.0 or config.sillage_exclude
+                or config.value_min > 0 or config.value_max < 5.0 or config.value_exclude):
+            score_key = (config.rating_min, config.rating_max, config.rating_exclude,
+                         config.longevity_min, config.longevity_max, config.longevity_exclude,
+                         config.sillage_min, config.sillage_max, config.sillage_exclude,
+                         config.value_min, config.value_max, config.value_exclude)
+            specs.append(("scores", score_key, self._mask_scores))
         if config.gender_preference:
-            fr = (p.fragrantica or {}).get("gender_votes", {})
-            my = (p.my_votes or {}).get("my_gender_votes", {})
-            matches_any_gender = False
-            for gender in config.gender_preference:
-                if int(fr.get(gender, 0) or 0) >= 10 or int(my.get(gender, 0) or 0) > 0:
-                    matches_any_gender = True
-                    break
-            if not matches_any_gender:
-                return False
-        
-        # Tags (V2: use tag_ids)
+            specs.append(("gender", tuple(config.gender_preference), self._mask_gender))
         if config.tags:
-            p_tags = set(self.app.get_tag_name(tid) for tid in p.tag_ids) if self.app else set()
-            config_tags = set(config.tags)
-            if config.tags_logic == "and":
-                if not config_tags.issubset(p_tags):
-                    return False
-            else:  # or
-                if not config_tags.intersection(p_tags):
+            specs.append(("tags", (tuple(config.tags), config.tags_logic),
+                          self._mask_tags))
+        if config.has_my_vote or config.has_fragrantica:
+            specs.append(("vote_status", (config.has_my_vote, config.has_fragrantica),
+                          self._mask_vote_status))
+        return specs
+
+    def _mask_over(self, pred):
+        """Evaluate a per-perfume predicate into a boolean mask"""
+        if np is not None:
+            return np.fromiter((pred(p) for p in self.perfumes), dtype=bool,
+                               count=len(self.perfumes))
+        return bytearray(1 if pred(p) else 0 for p in self.perfumes)
+
+    def _mask_brands(self, config: FilterConfig):
+        brand_set = frozenset(config.brands)
+        brand_names = self._brand_name_by_id
+        return self._mask_over(lambda p: brand_names.get(p.brand_id, "") in brand_set)
+
+    def _mask_states(self, config: FilterConfig):
+        want_owned = "owned" in config.states
+        want_tested = "tested" in config.states
+        want_wishlist = "wishlist" in config.states
+        state_cache = self._state_cache
+        app = self.app
+
+        def pred(p: Perfume) -> bool:
+            cached = state_cache.get(p.id)
+            if cached is None:
+                p_tag_names = [app.get_tag_name(tid) for tid in p.tag_ids] if app else []
+                cached = derive_state(p, p_tag_names, app.app_data.owned_ml_include_formats)
+                state_cache[p.id] = cached
+            state, owned_ml = cached
+            return ((want_owned and owned_ml > 0)
+                    or (want_tested and "Smelled" in state)
+                    or (want_wishlist and state == "Wishlist"))
+
+        return self._mask_over(pred)
+
+    def _mask_when(self, config: FilterConfig):
+        req = 0
+        for item in config.seasons + config.times:
+            req |= _SEASON_TIME_BITS.get(item, 0)
+        if np is not None:
+            return (self._when_mask_array() & req) != 0
+        when_cache = self._when_mask_cache
+
+        def pred(p: Perfume) -> bool:
+            mask = when_cache.get(p.id)
+            if mask is None:
+                mask = when_cache[p.id] = _when_eligibility_mask(p)
+            return bool(mask & req)
+
+        return self._mask_over(pred)
+
+    def _mask_scores(self, config: FilterConfig):
+        if self._soa is not None:
+            mask = None
+            for name, _, _, top in PerfumeSoA._BLOCKS:
+                lo = getattr(config, name + "_min")
+                hi = getattr(config, name + "_max")
+                exclude = getattr(config, name + "_exclude")
+                if not (lo > 0 or hi < top or exclude):
+                    continue
+                s = self._soa.scores[name]
+                # Same semantics as _matches_filter: include mode keeps
+                # in-range perfumes that have data, exclude mode drops them
+                # (so no-data perfumes always pass exclude)
+                hit = (s > 0) & (s >= lo) & (s <= hi)
+                block = ~hit if exclude else hit
+                mask = block if mask is None else mask & block
+            return mask
+        blocks = []
+        for name, votes_key, keys, top in PerfumeSoA._BLOCKS:
+            lo = getattr(config, name + "_min")
+            hi = getattr(config, name + "_max")
+            exclude = getattr(config, name + "_exclude")
+            if lo > 0 or hi < top or exclude:
+                blocks.append((votes_key, keys, lo, hi, exclude))
+
+        def pred(p: Perfume) -> bool:
+            for votes_key, keys, lo, hi, exclude in blocks:
+                score = get_fragrantica_score(p, votes_key, keys)
+                hit = score > 0 and lo <= score <= hi
+                if hit if exclude else not hit:
                     return False
-        
-        # Vote status
-        if config.has_my_vote:
-            if not p.my_votes or not any(p.my_votes.values()):
+            return True
+
+        return self._mask_over(pred)
+
+    def _mask_gender(self, config: FilterConfig):
+        req = 0
+        for g in config.gender_preference:
+            req |= _GENDER_BITS.get(g, 0)
+        if np is not None:
+            return (self._gender_mask_array() & req) != 0
+        gender_cache = self._gender_mask_cache
+
+        def pred(p: Perfume) -> bool:
+            mask = gender_cache.get(p.id)
+            if mask is None:
+                mask = gender_cache[p.id] = _gender_eligibility_mask(p)
+            return bool(mask & req)
+
+        return self._mask_over(pred)
+
+    def _tag_bit(self, name: str) -> int:
+        """Bit assigned to a tag name, allocating on first sight"""
+        bit = self._tag_bit_of.get(name)
+        if bit is None:
+            bit = self._tag_bit_of[name] = 1 << len(self._tag_bit_of)
+        return bit
+
+    def _mask_tags(self, config: FilterConfig):
+        cfg_bits = 0
+        for t in config.tags:
+            cfg_bits |= self._tag_bit(t)
+        tags_and = config.tags_logic == "and"
+        tag_bit = self._tag_bit
+        tag_bits = self._tag_bits
+        tag_names = self._tag_name_by_id
+
+        def pred(p: Perfume) -> bool:
+            pb = tag_bits.get(p.id)
+            if pb is None:
+                pb = 0
+                for tid in p.tag_ids:
+                    pb |= tag_bit(tag_names.get(tid, ""))
+                tag_bits[p.id] = pb
+            if tags_and:
+                return pb & cfg_bits == cfg_bits
+            return bool(pb & cfg_bits)
+
+        return self._mask_over(pred)
+
+    def _mask_vote_status(self, config: FilterConfig):
+        want_my_vote = config.has_my_vote
+        want_fragrantica = config.has_fragrantica
+        flags_cache = self._vote_flags_cache
+
+        def pred(p: Perfume) -> bool:
+            flags = flags_cache.get(p.id)
+            if flags is None:
+                flags = (bool(p.my_votes) and any(p.my_votes.values()),
+                         bool(p.fragrantica) and any(p.fragrantica.values()))
+                flags_cache[p.id] = flags
+            has_my, has_fr = flags
+            if want_my_vote and not has_my:
                 return False
-        
-        if config.has_fragrantica:
-            if not p.fragrantica or not any(p.fragrantica.values()):
+            if want_fragrantica and not has_fr:
                 return False
-        
-        return True
+            return True
+
+        return self._mask_over(pred)
     
     def _clear_all(self):
         """Clear all filters"""
-        self.brands_selected = []
-        self._refresh_brands_listbox()
-        self.concentrations_selected = []
-        self._refresh_concs_listbox()
-        self.locations_selected = []
-        self._refresh_locs_listbox()
-        for var in self.vars_states.values():
-            var.set(False)
-        for var in self.vars_seasons.values():
-            var.set(False)
-        for var in self.vars_times.values():
-            var.set(False)
-        # Reset score ranges
-        self.var_rating_min.set(0.0)
-        self.var_rating_max.set(5.0)
-        self.var_rating_exclude.set(False)
-        self.var_longevity_min.set(0.0)
-        self.var_longevity_max.set(5.0)
-        self.var_longevity_exclude.set(False)
-        self.var_sillage_min.set(0.0)
-        self.var_sillage_max.set(4.0)
-        self.var_sillage_exclude.set(False)
-        self.var_value_min.set(0.0)
-        self.var_value_max.set(5.0)
-        self.var_value_exclude.set(False)
-        for var in self.vars_genders.values():
-            var.set(False)
-        self.tags_selected = []
-        self._refresh_tags_listbox()
-        self.var_tags_logic.set("or")
-        self.var_has_my_vote.set(False)
-        self.var_has_fragrantica.set(False)
+        # Batch the whole reset: no intermediate recounts, one at the end
+        self._suppress_recount = True
+        try:
+            self.brands_selected = []
+            self._refresh_brands_listbox()
+            self.concentrations_selected = []
+            self._refresh_concs_listbox()
+            self.locations_selected = []
+            self._refresh_locs_listbox()
+            for var in self.vars_states.values():
+                var.set(False)
+            for var in self.vars_seasons.values():
+                var.set(False)
+            for var in self.vars_times.values():
+                var.set(False)
+            # Reset score ranges
+            self.var_rating_min.set(0.0)
+            self.var_rating_max.set(5.0)
+            self.var_rating_exclude.set(False)
+            self.var_longevity_min.set(0.0)
+            self.var_longevity_max.set(5.0)
+            self.var_longevity_exclude.set(False)
+            self.var_sillage_min.set(0.0)
+            self.var_sillage_max.set(4.0)
+            self.var_sillage_exclude.set(False)
+            self.var_value_min.set(0.0)
+            self.var_value_max.set(5.0)
+            self.var_value_exclude.set(False)
+            for var in self.vars_genders.values():
+                var.set(False)
+            self.tags_selected = []
+            self._refresh_tags_listbox()
+            self.var_tags_logic.set("or")
+            self.var_has_my_vote.set(False)
+            self.var_has_fragrantica.set(False)
+        finally:
+            self._suppress_recount = False
         self._update_result_count()
         self._update_active_text()
     
     def _update_active_text(self):
         """Update the active filters text display"""
-        self.active_text_frame.config(state="normal")
-        self.active_text_frame.delete("1.0", "end")
         # Build current config from UI state
         temp_config = self._build_config()
         self.current_config = temp_config  # Update for text generation
-        active_filters_text = self._get_active_filters_text()
-        self.active_text_frame.insert("1.0", active_filters_text if active_filters_text else "(No active filters)")
+        active_filters_text = self._get_active_filters_text() or "(No active filters)"
+
+        # Same text as currently shown: skip the Text widget rewrite
+        if active_filters_text == self._active_text_cache:
+            return
+        self._active_text_cache = active_filters_text
+
+        self.active_text_frame.config(state="normal")
+        self.active_text_frame.delete("1.0", "end")
+        self.active_text_frame.insert("1.0", active_filters_text)
         self.active_text_frame.config(state="disabled")
     
     def _apply(self):
@@ -3290,7 +4203,80 @@ class FilterDialog(tk.Toplevel):
         self.result = self._build_config()
         if self.on_apply:
             self.on_apply(self.result)
-        self.destroy()
+        self.withdraw()
+
+    def _invalidate_data_caches(self):
+        """Drop everything derived from perfume data (not from the config)"""
+        self._soa = PerfumeSoA(self.perfumes) if np is not None else None
+        self._state_cache.clear()
+        self._when_mask_cache.clear()
+        self._gender_mask_cache.clear()
+        self._when_arr = None
+        self._gender_arr = None
+        self._dim_masks.clear()
+        self._vote_flags_cache.clear()
+        self._tag_bits.clear()
+        self._active_text_cache = None
+
+    def _on_data_changed(self):
+        """Called by App.save() while the dialog is live: the dialog is
+        non-modal, so quick-log edits can change perfume data under it"""
+        if not self.winfo_exists():
+            return
+        self._invalidate_data_caches()
+        if self.state() == "normal":
+            self._schedule_result_count()
+
+    def reopen(self, current_config: FilterConfig, perfumes: List[Perfume], on_apply):
+        """Show the cached dialog again: rebind data and vars, no widget rebuild"""
+        self.current_config = current_config
+        self.perfumes = perfumes
+        self.on_apply = on_apply
+        self.result = None
+        # Perfume data may have changed while hidden: drop derived caches
+        self._invalidate_data_caches()
+        self._load_config_into_vars(current_config)
+        self.deiconify()
+        self.lift()
+        self._update_result_count()
+
+    def _load_config_into_vars(self, config: FilterConfig):
+        """Push a config into the existing Tk vars and pool lists"""
+        self.brands_selected = list(config.brands)
+        self.concentrations_selected = list(config.concentrations)
+        self.locations_selected = list(config.locations)
+        self._refresh_brands_listbox()
+        self._refresh_concs_listbox()
+        self._refresh_locs_listbox()
+        for s, var in self.vars_states.items():
+            var.set(s in config.states)
+        for s, var in self.vars_seasons.items():
+            var.set(s in config.seasons)
+        for t, var in self.vars_times.items():
+            var.set(t in config.times)
+        self.var_rating_min.set(config.rating_min)
+        self.var_rating_max.set(config.rating_max)
+        self.var_rating_exclude.set(config.rating_exclude)
+        self.var_longevity_min.set(config.longevity_min)
+        self.var_longevity_max.set(config.longevity_max)
+        self.var_longevity_exclude.set(config.longevity_exclude)
+        self.var_sillage_min.set(config.sillage_min)
+        self.var_sillage_max.set(config.sillage_max)
+        self.var_sillage_exclude.set(config.sillage_exclude)
+        self.var_value_min.set(config.value_min)
+        self.var_value_max.set(config.value_max)
+        self.var_value_exclude.set(config.value_exclude)
+        # Sliders don't trace their vars; reposition handles and labels
+        for slider in self._range_sliders:
+            slider._refresh()
+        self._flush_score_labels()
+        for g, var in self.vars_genders.items():
+            var.set(g in config.gender_preference)
+        self.tags_selected = list(config.tags)
+        self._refresh_tags_listbox()
+        self.var_tags_logic.set(config.tags_logic)
+        self.var_has_my_vote.set(config.has_my_vote)
+        self.var_has_fragrantica.set(config.has_fragrantica)
 
 
 # -----------------------------
@@ -3422,7 +4408,18 @@ class App(tk.Tk):
         self.app_data: AppData = load_app_data()
         self.perfumes: List[Perfume] = self.app_data.perfumes  # Alias for compatibility
         self.filtered_ids: List[str] = []
-        
+
+        # Debounced save bookkeeping + flush on exit so no edit is lost
+        self._save_after_id: Optional[str] = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Purchase type names rarely change; cached until ManageDataDialog
+        # edits the formats tab
+        self._purchase_type_names_cache: Optional[List[str]] = None
+
+        # Filter dialog kept alive across opens (withdrawn, not destroyed)
+        self._filter_dialog: Optional["FilterDialog"] = None
+
         # Persistent expand/collapse state
         self.expanded_sections = {
             "rating_votes": False,
@@ -3576,8 +4573,10 @@ class App(tk.Tk):
         return result
     
     def get_all_purchase_type_names(self) -> List[str]:
-        """Get all purchase type names in mapping order"""
-        return list(self.app_data.purchase_types_map.values())
+        """Get all purchase type names in mapping order (cached)"""
+        if self._purchase_type_names_cache is None:
+            self._purchase_type_names_cache = list(self.app_data.purchase_types_map.values())
+        return self._purchase_type_names_cache
 
     # ---- styling
     def _build_style(self):
@@ -3762,7 +4761,6 @@ class App(tk.Tk):
         ttk.Label(quick_frame, text="@", style="Panel.TLabel").pack(side="left")
         self.var_quick_location = tk.StringVar(value="")
         self.quick_location_combo = ttk.Combobox(quick_frame, textvariable=self.var_quick_location, width=12)
-        self.quick_location_combo["values"] = self.get_all_outlet_names()
         make_combobox_searchable(self.quick_location_combo, self.get_all_outlet_names())
         self.quick_location_combo.pack(side="left", fill="x", expand=True, padx=(2, 6))
         
@@ -3953,12 +4951,49 @@ class App(tk.Tk):
         self.detail_canvas.itemconfig(self.detail_canvas_window, width=canvas_width)
     
     def save(self):
+        # Debounced: rapid edits (vote clicking, typing) collapse into a
+        # single snapshot 250 ms after the last one, written off-thread.
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(250, self._flush_save)
+        # The filter dialog is non-modal; its caches go stale whenever a
+        # mutation path lands here
+        dlg = self._filter_dialog
+        if dlg is not None and dlg.winfo_exists():
+            dlg._on_data_changed()
+
+    def _flush_save(self):
+        self._save_after_id = None
         for p in self.perfumes:
             p.updated_at = now_ts()
         # Re-sort mapping tables based on their sort modes
         self._resort_mappings()
-        save_app_data(self.app_data)  # V2: Save with mapping tables
+        queue_save(self.app_data)  # V2: Save with mapping tables
         # Silent save - no popup
+
+    def _on_close(self):
+        # Destroy child dialogs first: a dirty ManageDataDialog flushes
+        # its edits on destroy, and that has to land before the final
+        # disk flush below rather than in the post-mainloop cascade
+        for child in list(self.winfo_children()):
+            if isinstance(child, tk.Toplevel):
+                child.destroy()
+        # Write any debounced edits before the window goes away
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._flush_save()
+        if not flush_saves():
+            # The background write failed (disk full, permissions...);
+            # retry synchronously so the failure is visible before the
+            # data is gone with the process
+            try:
+                save_app_data(self.app_data)
+            except OSError as e:
+                if not messagebox.askyesno(
+                        "Save Failed",
+                        f"Could not save data:\n{e}\n\nQuit anyway and lose unsaved changes?"):
+                    return
+        self.destroy()
     
     def _resort_mappings(self):
         """Re-sort all mapping tables based on their sort modes"""
@@ -4019,7 +5054,11 @@ class App(tk.Tk):
             current_map.clear()
             for item_id, item, _, _ in items:
                 current_map[item_id] = item
-    
+            if tab_id == "purchase_types":
+                # The cached name list mirrors map order; count-mode
+                # sorting can reorder it outside ManageDataDialog edits
+                self._purchase_type_names_cache = None
+
     def ui_open_sort(self):
         """Open sort configuration dialog"""
         def on_apply(config: SortConfig):
@@ -4035,8 +5074,24 @@ class App(tk.Tk):
             self.filter_config = config
             self._update_button_states()
             self._refresh_list()
-        
-        FilterDialog(self, self.filter_config, self.perfumes, self.filter_expanded_state, on_apply, app=self)
+
+        # Reuse the cached dialog when possible; rebuilding the whole
+        # widget tree on every open is the expensive part. A vocabulary
+        # change (brands/tags/... renamed or added) invalidates combobox
+        # values captured at build time, so rebuild in that case.
+        dlg = self._filter_dialog
+        if dlg is not None and dlg.winfo_exists() and dlg._vocab_sig == self._filter_vocab_sig():
+            dlg.reopen(self.filter_config, self.perfumes, on_apply)
+        else:
+            if dlg is not None and dlg.winfo_exists():
+                dlg.destroy()
+            self._filter_dialog = FilterDialog(self, self.filter_config, self.perfumes, self.filter_expanded_state, on_apply, app=self)
+
+    def _filter_vocab_sig(self) -> tuple:
+        """Signature of the name vocabularies the filter dialog builds from"""
+        d = self.app_data
+        return (tuple(d.brands_map.items()), tuple(d.tags_map.items()),
+                tuple(d.concentrations_map.items()), tuple(d.outlets_map.items()))
     
     def ui_open_manage_data(self):
         """Open manage data dialog for brands, tags, etc."""
@@ -4099,9 +5154,19 @@ class App(tk.Tk):
         # Search query
         q = (self.var_search.get() or "").strip().lower()
         
+        # Vectorized cull on the score-range filters: evaluate the four
+        # block masks as array compares over a SoA view, then let
+        # _matches_filter recheck survivors (its score lookups hit the
+        # per-perfume cache, so the recheck costs nothing).
+        score_mask = None
+        if np is not None and self.perfumes:
+            score_mask = PerfumeSoA(self.perfumes).filter_mask(self.filter_config)
+
         # Filter perfumes
         filtered = []
-        for p in self.perfumes:
+        for i, p in enumerate(self.perfumes):
+            if score_mask is not None and not score_mask[i]:
+                continue
             # Apply filter config
             if not self._matches_filter(p, self.filter_config):
                 continue
@@ -4197,8 +5262,8 @@ class App(tk.Tk):
             check_items = config.seasons + config.times
             matches_when = False
             for item in check_items:
-                fr_val = int(fr_votes.get(item, 0) or 0)
-                my_val = int(my_votes.get(item, 0) or 0)
+                fr_val = fr_votes.get(item, 0)
+                my_val = my_votes.get(item, 0)
                 if fr_val >= 10 or my_val > 0:
                     matches_when = True
                     break
@@ -4211,8 +5276,7 @@ class App(tk.Tk):
         
         # Rating (range with include/exclude)
         if config.rating_min > 0 or config.rating_max < 5.0 or config.rating_exclude:
-            fr = (p.fragrantica or {}).get("rating_votes", {})
-            score = calculate_rating_score(fr, RATING_5)
+            score = get_fragrantica_score(p, "rating_votes", RATING_5)
             has_data = score > 0
             in_range = config.rating_min <= score <= config.rating_max
             if config.rating_exclude:
@@ -4224,8 +5288,7 @@ class App(tk.Tk):
         
         # Longevity (range with include/exclude)
         if config.longevity_min > 0 or config.longevity_max < 5.0 or config.longevity_exclude:
-            fr = (p.fragrantica or {}).get("longevity_votes", {})
-            score = calculate_longevity_score(fr, LONGEVITY_5)
+            score = get_fragrantica_score(p, "longevity_votes", LONGEVITY_5)
             has_data = score > 0
             in_range = config.longevity_min <= score <= config.longevity_max
             if config.longevity_exclude:
@@ -4237,8 +5300,7 @@ class App(tk.Tk):
         
         # Sillage (range with include/exclude)
         if config.sillage_min > 0 or config.sillage_max < 4.0 or config.sillage_exclude:
-            fr = (p.fragrantica or {}).get("sillage_votes", {})
-            score = calculate_sillage_score(fr, SILLAGE_4)
+            score = get_fragrantica_score(p, "sillage_votes", SILLAGE_4)
             has_data = score > 0
             in_range = config.sillage_min <= score <= config.sillage_max
             if config.sillage_exclude:
@@ -4250,8 +5312,7 @@ class App(tk.Tk):
         
         # Value (range with include/exclude)
         if config.value_min > 0 or config.value_max < 5.0 or config.value_exclude:
-            fr = (p.fragrantica or {}).get("value_votes", {})
-            score = calculate_value_score(fr, VALUE_5)
+            score = get_fragrantica_score(p, "value_votes", VALUE_5)
             has_data = score > 0
             in_range = config.value_min <= score <= config.value_max
             if config.value_exclude:
@@ -4267,7 +5328,7 @@ class App(tk.Tk):
             my = (p.my_votes or {}).get("my_gender_votes", {})
             matches_any_gender = False
             for gender in config.gender_preference:
-                if int(fr.get(gender, 0) or 0) >= 10 or int(my.get(gender, 0) or 0) > 0:
+                if fr.get(gender, 0) >= 10 or my.get(gender, 0) > 0:
                     matches_any_gender = True
                     break
             if not matches_any_gender:
@@ -4320,23 +5381,19 @@ class App(tk.Tk):
             return (p.name.lower(),) if order == "asc" else (p.name.lower(), True)
         
         elif dimension == "rating":
-            fr = (p.fragrantica or {}).get("rating_votes", {})
-            score = calculate_rating_score(fr, RATING_5)
+            score = get_fragrantica_score(p, "rating_votes", RATING_5)
             return (-score,) if order == "desc" else (score,)
         
         elif dimension == "longevity":
-            fr = (p.fragrantica or {}).get("longevity_votes", {})
-            score = calculate_longevity_score(fr, LONGEVITY_5)
+            score = get_fragrantica_score(p, "longevity_votes", LONGEVITY_5)
             return (-score,) if order == "desc" else (score,)
         
         elif dimension == "sillage":
-            fr = (p.fragrantica or {}).get("sillage_votes", {})
-            score = calculate_sillage_score(fr, SILLAGE_4)
+            score = get_fragrantica_score(p, "sillage_votes", SILLAGE_4)
             return (-score,) if order == "desc" else (score,)
         
         elif dimension == "gender":
-            fr = (p.fragrantica or {}).get("gender_votes", {})
-            score = calculate_gender_score(fr, GENDER_5)
+            score = get_fragrantica_score(p, "gender_votes", GENDER_5)
             # female_first: lower score first, male_first: higher score first
             if order == "female_first":
                 return (score,)
@@ -4346,8 +5403,7 @@ class App(tk.Tk):
                 return (abs(score - 3.0),)
         
         elif dimension == "value":
-            fr = (p.fragrantica or {}).get("value_votes", {})
-            score = calculate_value_score(fr, VALUE_5)
+            score = get_fragrantica_score(p, "value_votes", VALUE_5)
             return (-score,) if order == "desc" else (score,)
         
         elif dimension == "state":
@@ -4754,12 +5810,9 @@ class App(tk.Tk):
         
         # Validate date if provided
         date_str = self.var_quick_date.get().strip()
-        if date_str:
-            try:
-                datetime.strptime(date_str, "%Y-%m-%d")
-            except ValueError:
-                messagebox.showwarning("Invalid Date", "Date format must be YYYY-MM-DD")
-                return
+        if date_str and not _valid_date(date_str):
+            messagebox.showwarning("Invalid Date", "Date format must be YYYY-MM-DD")
+            return
         
         location = self.var_quick_location.get().strip()
         
@@ -5637,7 +6690,7 @@ class App(tk.Tk):
                 block[k] = 0
         else:
             # Get current state
-            was_on = int(block.get(chosen_key, 0) or 0) > 0
+            was_on = block.get(chosen_key, 0) > 0
             
             if is_multi_choice:
                 # Multi-choice: toggle this option without affecting others
@@ -5650,7 +6703,7 @@ class App(tk.Tk):
                     block[chosen_key] = 1
 
         # Remove empty blocks to keep JSON clean
-        if sum(int(block.get(k, 0) or 0) for k in keys) <= 0:
+        if sum(block.get(k, 0) for k in keys) <= 0:
             if my_block_key in p.my_votes:
                 del p.my_votes[my_block_key]
         else:
@@ -5881,7 +6934,8 @@ class App(tk.Tk):
         # Add metadata
         p.fragrantica["source"] = "fragrantica"
         p.fragrantica["last_updated"] = now_ts()
-        
+        p._score_cache.clear()
+
         self._on_select()
         self._refresh_list()
         self.save()